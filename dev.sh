@@ -289,9 +289,9 @@ cmd_update() {
         exit 1
     fi
 
-    # Apply incremental migration if meta schema doesn't exist yet
+    # Apply incremental migration if its newest table does not exist yet
     if ! container_psql "$cid" -d ripariandb \
-        -c "SELECT 1 FROM meta.etl_runs LIMIT 0" >/dev/null 2>&1; then
+        -c "SELECT 1 FROM meta.layer_state LIMIT 0" >/dev/null 2>&1; then
         info "Applying incremental migration..."
         docker exec -i "$cid" bash -c \
             'PGPASSWORD=$POSTGRES_PASSWORD psql -U postgres -d ripariandb' \
@@ -0,0 +1,76 @@
+"""Database connection settings shared by the ETL entrypoints.
+
+Kept free of geospatial imports so resolving the connection URL (e.g.
+at scheduled-mode startup) does not load GDAL/PROJ; SQLAlchemy is only
+imported when an engine is created.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import TYPE_CHECKING
+from urllib.parse import quote_plus
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+# ``Key=Value`` pairs of an ADO.NET connection string; values may contain "="
+_ADO_RE = re.compile(r"([^=;]+)=([^;]*)")
+
+
+def resolve_database_url() -> str:
+    """Resolve the PostgreSQL connection URL from Aspire or env vars.
+
+    Aspire injects several env vars; prefer the URI form. Fall back to
+    converting the ADO.NET-style ConnectionStrings__ripariandb.
+    """
+    # 1. Aspire URI (already a proper postgresql:// URL)
+    url = os.environ.get("RIPARIANDB_URI") or os.environ.get("DATABASE_URL")
+    if url:
+        return url
+
+    # 2. ADO.NET connection string → convert to SQLAlchemy URL
+    ado = os.environ.get("ConnectionStrings__ripariandb")
+    if ado:
+        parts = {
+            key.strip().lower(): val.strip()
+            for key, val in _ADO_RE.findall(ado)
+        }
+        host = parts.get("host", "localhost")
+        port = parts.get("port", "5432")
+        user = parts.get("username", "postgres")
+        password = parts.get("password", "")
+        database = parts.get("database", "ripariandb")
+        return f"postgresql://{quote_plus(user)}:{quote_plus(password)}@{host}:{port}/{database}"
+
+    return ""
+
+
+def create_pooled_engine(url: str) -> Engine:
+    """Create the engine shared by every run in this process.
+
+    The pool is sized for the concurrent bronze loads and NDVI workers and
+    pre-pings connections so long idle gaps between scheduled runs do
+    not surface stale-connection errors. ``values_plus_batch`` makes
+    psycopg2 page executemany calls with ``execute_batch`` instead of
+    one round-trip per row.
+
+    Args:
+        url: PostgreSQL connection URL.
+
+    Returns:
+        Configured SQLAlchemy engine.
+    """
+    from sqlalchemy import create_engine
+
+    return create_engine(
+        url,
+        pool_size=8,
+        max_overflow=4,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        executemany_batch_page_size=500,
+    )
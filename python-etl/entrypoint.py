@@ -5,7 +5,7 @@ Usage:
     python entrypoint.py --mode full        # Explicit full run
     python entrypoint.py --mode incremental # Incremental upsert
     python entrypoint.py --mode ndvi        # NDVI refresh only
-    python entrypoint.py --mode all         # Incremental + NDVI
+    python entrypoint.py --mode all         # Incremental, then NDVI
     python entrypoint.py --mode scheduled   # Long-lived scheduler
 """
 
@@ -13,87 +13,166 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
+from typing import TYPE_CHECKING, Any, Callable
 
-from sqlalchemy import create_engine
-
-from etl_pipeline import (
-    ArcGISFeatureClient,
-    EtlPipeline,
-    PostGISWriter,
-    _resolve_database_url,
-)
-from ndvi_processor import (
-    NdviProcessor,
-    PlanetaryComputerSearcher,
-    PostGISNdviWriter,
-)
-from run_tracker import RunTracker
+from db import create_pooled_engine, resolve_database_url
+
+# Heavy geospatial/database modules (geopandas, rasterio, sqlalchemy) are
+# imported inside the functions that need them, so ``--help`` and
+# scheduled-mode startup don't pay for GDAL/PROJ initialisation, and
+# non-NDVI runs never import the raster stack.
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+    from etl_pipeline import EtlPipeline
+    from ndvi_processor import PlanetaryComputerSearcher
 
 logger = logging.getLogger(__name__)
 
+# Rows per COPY / INSERT batch for both PostGIS writers
+ETL_BATCH_SIZE = int(os.environ.get("ETL_BATCH_SIZE", "10000"))
+
+# Optional COG overview level for NDVI clips (unset = native resolution)
+_overview = os.environ.get("NDVI_OVERVIEW_LEVEL", "")
+NDVI_OVERVIEW_LEVEL = int(_overview) if _overview else None
+
+# Process-wide database URL and engine, resolved on first use
+_URL: str | None = None
+_ENGINE: Engine | None = None
+_SEARCHER: PlanetaryComputerSearcher | None = None
+
+
+def get_database_url() -> str:
+    """Return the database URL, resolving it from the environment once.
+
+    Returns:
+        The connection URL, or an empty string if none is configured.
+    """
+    global _URL
+    if _URL is None:
+        _URL = resolve_database_url()
+    return _URL
+
+
+def get_engine() -> Engine:
+    """Return the process-wide engine, creating it on first use.
+
+    Returns:
+        Shared SQLAlchemy engine.
+
+    Raises:
+        RuntimeError: If no database URL is configured.
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        url = get_database_url()
+        if not url:
+            raise RuntimeError("No database URL found")
+        _ENGINE = create_pooled_engine(url)
+    return _ENGINE
+
+
+def get_searcher() -> PlanetaryComputerSearcher:
+    """Return the process-wide STAC searcher, creating it on first use.
+
+    Reusing one searcher keeps the opened catalog and its cache of recent
+    searches across scheduled NDVI runs.
+
+    Returns:
+        Shared Planetary Computer searcher.
+    """
+    global _SEARCHER
+    if _SEARCHER is None:
+        from ndvi_processor import PlanetaryComputerSearcher
+
+        _SEARCHER = PlanetaryComputerSearcher()
+    return _SEARCHER
+
 
-def execute_run(update_type: str) -> None:
+def execute_run(update_type: str, engine: Engine | None = None) -> None:
     """Execute a single ETL run of the given type.
 
+    Runs the mode's steps in order, merges their stats, and records the
+    outcome in ``meta.etl_runs``.
+
     Args:
         update_type: One of 'full', 'incremental', 'ndvi', 'all'.
+        engine: SQLAlchemy engine; defaults to the process-wide engine.
+
+    Raises:
+        ValueError: If ``update_type`` is not a known mode.
     """
-    url = _resolve_database_url()
-    if not url:
-        logger.error("No database URL found")
-        sys.exit(1)
+    steps = MODES.get(update_type)
+    if steps is None:
+        raise ValueError(f"Unknown update type: {update_type}")
+    if engine is None:
+        engine = get_engine()
+
+    from etl_pipeline import ArcGISFeatureClient, EtlPipeline, PostGISWriter
+    from run_tracker import RunTracker
 
-    engine = create_engine(url)
     tracker = RunTracker(engine)
     pipeline = EtlPipeline(
         client=ArcGISFeatureClient(),
-        writer=PostGISWriter(engine),
+        writer=PostGISWriter(engine, batch_size=ETL_BATCH_SIZE),
     )
 
     run_id = tracker.start_run(update_type)
     try:
-        if update_type == "full":
-            pipeline.run()
-            tracker.complete_run(run_id)
-
-        elif update_type == "incremental":
-            streams_changed, parcels_changed, buffers_changed = (
-                pipeline.run_incremental()
-            )
-            tracker.complete_run(
-                run_id,
-                streams_changed=streams_changed,
-                parcels_changed=parcels_changed,
-                buffers_changed=buffers_changed,
-            )
-
-        elif update_type == "ndvi":
-            count = _run_ndvi(engine)
-            tracker.complete_run(run_id, records_inserted=count)
-
-        elif update_type == "all":
-            streams_changed, parcels_changed, buffers_changed = (
-                pipeline.run_incremental()
-            )
-            ndvi_count = _run_ndvi(engine)
-            tracker.complete_run(
-                run_id,
-                records_inserted=ndvi_count,
-                streams_changed=streams_changed,
-                parcels_changed=parcels_changed,
-                buffers_changed=buffers_changed,
-            )
-
-        else:
-            raise ValueError(f"Unknown update type: {update_type}")
+        # Steps run in order: the incremental step may regenerate buffers
+        # (and their health rows) that the NDVI step then reads and writes
+        stats: RunStats = {}
+        for step in steps:
+            stats.update(step(pipeline, engine))
+        tracker.complete_run(run_id, **stats)
 
     except Exception as exc:
         tracker.fail_run(run_id, str(exc))
         raise
 
 
-def _run_ndvi(engine: object) -> int:
+# ---------------------------------------------------------------------------
+# Run steps — each returns RunTracker.complete_run keyword arguments
+# ---------------------------------------------------------------------------
+
+RunStats = dict[str, Any]
+Step = Callable[["EtlPipeline", "Engine"], RunStats]
+
+
+def _step_full(pipeline: EtlPipeline, _engine: Engine) -> RunStats:
+    """Full bronze -> silver -> gold reload."""
+    pipeline.run()
+    return {}
+
+
+def _step_incremental(pipeline: EtlPipeline, _engine: Engine) -> RunStats:
+    """Incremental bronze upsert with change-driven silver/gold recompute."""
+    streams_changed, parcels_changed, buffers_changed = (
+        pipeline.run_incremental()
+    )
+    return {
+        "streams_changed": streams_changed,
+        "parcels_changed": parcels_changed,
+        "buffers_changed": buffers_changed,
+    }
+
+
+def _step_ndvi(_pipeline: EtlPipeline, engine: Engine) -> RunStats:
+    """Incremental NDVI vegetation health refresh."""
+    return {"records_inserted": _run_ndvi(engine)}
+
+
+MODES: dict[str, list[Step]] = {
+    "full": [_step_full],
+    "incremental": [_step_incremental],
+    "ndvi": [_step_ndvi],
+    "all": [_step_incremental, _step_ndvi],
+}
+
+
+def _run_ndvi(engine: Engine) -> int:
     """Run incremental NDVI processing.
 
     Args:
@@ -102,10 +181,13 @@ def _run_ndvi(engine: object) -> int:
     Returns:
         Number of new readings written.
     """
+    from ndvi_processor import NdviProcessor, PostGISNdviWriter
+
     processor = NdviProcessor(
-        searcher=PlanetaryComputerSearcher(),
-        writer=PostGISNdviWriter(engine),
+        searcher=get_searcher(),
+        writer=PostGISNdviWriter(engine, batch_size=ETL_BATCH_SIZE),
         engine=engine,
+        overview_level=NDVI_OVERVIEW_LEVEL,
     )
     return processor.process_buffers_incremental()
 
@@ -125,9 +207,16 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    import os
     mode = args.mode or os.environ.get("ETL_MODE", "full")
 
+    # Fail fast: scheduled mode would otherwise only fail on its first tick
+    if not get_database_url():
+        logger.error(
+            "No database URL found. Set RIPARIANDB_URI, DATABASE_URL, "
+            "or ConnectionStrings__ripariandb"
+        )
+        sys.exit(1)
+
     if mode == "scheduled":
         from scheduler import get_schedule_config, run_scheduled
         run_scheduled(execute_run, get_schedule_config())
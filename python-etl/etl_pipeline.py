@@ -6,17 +6,32 @@ medallion architecture (bronze -> silver -> gold) in PostGIS.
 Study area: San Juan Basin, HUC8 14080101.
 """
 
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
+import json
 import logging
-import os
-import re
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Iterator, Protocol, runtime_checkable
 
 import geopandas as gpd
+import ijson
+import numpy as np
+import pandas as pd
 import requests
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+import shapely
+from pyproj import Transformer
+from requests.adapters import HTTPAdapter
+from sqlalchemy import TextClause, text
+from sqlalchemy.engine import Connection, Engine
+from urllib3.util.retry import Retry
+
+from db import create_pooled_engine, resolve_database_url
 
 logger = logging.getLogger(__name__)
 
@@ -50,10 +65,20 @@ DEFAULT_BUFFER_DISTANCE_M = 30.48  # 100 feet
 
 # ArcGIS pagination
 ARCGIS_BATCH_SIZE = 1000
+ARCGIS_MAX_WORKERS = 4  # concurrent page requests; more risks throttling
+ARCGIS_GEOMETRY_PRECISION = 6  # decimal places, ~10 cm in EPSG:4269
+ARCGIS_MAX_RETRIES = 3  # retries on 502/503/504 with exponential backoff
+ARCGIS_USER_AGENT = "riparian-etl/1.0"
+
+# Rows per COPY statement when writing to PostGIS
+DEFAULT_WRITE_BATCH_SIZE = 10_000
 
 # NHDPlus feature type code for sinks
 SINK_FTYPE = 378
 
+# Parcels without an ID are unusable; filter them out server-side
+PARCELS_WHERE = "parcel_id IS NOT NULL"
+
 # Parcel field renaming (source API field -> database column)
 PARCEL_FIELD_MAP: dict[str, str] = {
     "parcel_id": "parcel_id",
@@ -72,12 +97,18 @@ PARCEL_FIELD_MAP: dict[str, str] = {
 
 @dataclass(frozen=True)
 class LayerChangeResult:
-    """Result of an incremental layer load."""
+    """Result of an incremental layer load.
+
+    ``digests`` holds ``(layer, digest)`` pairs for the layers that were
+    loaded; they are recorded only once the dependent silver/gold steps
+    succeed, so a failed run reloads the layer next time.
+    """
 
     layer_name: str
     inserted: int
     updated: int
     skipped: int
+    digests: tuple[tuple[str, str], ...] = ()
 
     @property
     def has_changes(self) -> bool:
@@ -106,6 +137,26 @@ class FeatureClient(Protocol):
         """Fetch features as a GeoDataFrame."""
         ...
 
+    def query_pages(
+        self,
+        url: str,
+        where: str = "1=1",
+        out_fields: str = "*",
+        geometry_filter: dict[str, Any] | None = None,
+        page_size: int = ARCGIS_BATCH_SIZE,
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Fetch every page of features, yielding non-empty GeoDataFrames."""
+        ...
+
+    def layer_digest(
+        self,
+        url: str,
+        where: str = "1=1",
+        geometry_filter: dict[str, Any] | None = None,
+    ) -> str | None:
+        """Fingerprint a layer query's source state, or None if unknown."""
+        ...
+
 
 @runtime_checkable
 class SpatialWriter(Protocol):
@@ -139,8 +190,32 @@ class SpatialWriter(Protocol):
         schema: str,
         conflict_column: str,
         update_columns: list[str],
+        repair_geometry: bool = False,
     ) -> tuple[int, int]:
-        """Upsert via ON CONFLICT. Returns (inserted, updated)."""
+        """Merge rows by conflict column. Returns (inserted, updated)."""
+        ...
+
+    def append_ignore_conflicts(
+        self,
+        gdf: gpd.GeoDataFrame,
+        table: str,
+        schema: str,
+        conflict_column: str,
+        repair_geometry: bool = False,
+    ) -> int:
+        """Append rows, skipping existing conflict keys. Returns inserted."""
+        ...
+
+    def get_layer_digest(self, layer: str) -> str | None:
+        """Return the digest stored by the last successful layer load."""
+        ...
+
+    def set_layer_digest(self, layer: str, digest: str) -> None:
+        """Record the digest of a successfully loaded layer."""
+        ...
+
+    def clear_layer_digests(self) -> None:
+        """Forget all stored digests so the next load refetches every layer."""
         ...
 
 
@@ -150,10 +225,32 @@ class SpatialWriter(Protocol):
 
 
 class ArcGISFeatureClient:
-    """Fetches geospatial features from ArcGIS REST API endpoints."""
+    """Fetches geospatial features from ArcGIS REST API endpoints.
 
-    def __init__(self, timeout: int = 120) -> None:
+    Args:
+        timeout: Per-request timeout in seconds.
+        max_workers: Maximum concurrent page requests in ``query_pages``.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 120,
+        max_workers: int = ARCGIS_MAX_WORKERS,
+    ) -> None:
         self._timeout = timeout
+        self._max_workers = max_workers
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": ARCGIS_USER_AGENT,
+        })
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers,
+            max_retries=Retry(
+                total=ARCGIS_MAX_RETRIES, backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+            ),
+        ))
 
     def query(
         self,
@@ -184,15 +281,177 @@ class ArcGISFeatureClient:
             where, out_fields, geometry_filter,
             result_offset, result_record_count,
         )
-        response = requests.get(
-            f"{url}/query", params=params, timeout=self._timeout,
-        )
-        response.raise_for_status()
-
-        features = response.json().get("features", [])
+        # Stream the body through ijson instead of materializing the full
+        # response text and dict tree with response.json()
+        with self._session.get(
+            f"{url}/query", params=params, timeout=self._timeout, stream=True,
+        ) as response:
+            response.raise_for_status()
+            logger.debug(
+                "ArcGIS page where=%s offset=%s content-encoding=%s",
+                where, result_offset, response.headers.get("Content-Encoding"),
+            )
+            response.raw.decode_content = True
+            features = list(
+                ijson.items(response.raw, "features.item", use_float=True),
+            )
         if not features:
             return gpd.GeoDataFrame()
-        return gpd.GeoDataFrame.from_features(features, crs="EPSG:4269")
+        return _features_to_frame(features)
+
+    def object_ids(
+        self,
+        url: str,
+        where: str = "1=1",
+        geometry_filter: dict[str, Any] | None = None,
+    ) -> tuple[str, list[int]] | None:
+        """Return the object-ID field and sorted IDs of matching features.
+
+        Args:
+            url: Full URL to the layer (including layer ID).
+            where: SQL WHERE clause for attribute filtering.
+            geometry_filter: Dict with geometry, geometryType, spatialRel.
+
+        Returns:
+            Tuple of (object-ID field name, ascending IDs), or None if the
+            server did not return them.
+        """
+        params = self._build_params(where, "", geometry_filter, None, None)
+        params.update({"returnIdsOnly": "true", "f": "json"})
+        try:
+            response = self._session.get(
+                f"{url}/query", params=params, timeout=self._timeout,
+            )
+            response.raise_for_status()
+            body = response.json()
+            return body["objectIdFieldName"], sorted(body["objectIds"] or [])
+        except (requests.RequestException, KeyError, TypeError, ValueError):
+            logger.warning("Object IDs unavailable for %s", url)
+            return None
+
+    def query_pages(
+        self,
+        url: str,
+        where: str = "1=1",
+        out_fields: str = "*",
+        geometry_filter: dict[str, Any] | None = None,
+        page_size: int = ARCGIS_BATCH_SIZE,
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Fetch every page of a layer, yielding pages in object-ID order.
+
+        Issues a ``returnIdsOnly`` request first and splits the IDs into
+        keyset windows of ``page_size`` (``OBJECTID BETWEEN lo AND hi``),
+        so each page costs the server an index range scan instead of a
+        scan-and-discard ``resultOffset``. Windows are fetched
+        concurrently, keeping at most ``2 * max_workers`` pages ahead of
+        the consumer. If the IDs are unavailable, pages are fetched
+        serially by offset until a short page. ``page_size`` must not
+        exceed the layer's ``maxRecordCount``.
+
+        Args:
+            url: Full URL to the layer (including layer ID).
+            where: SQL WHERE clause for attribute filtering.
+            out_fields: Comma-separated field names or "*".
+            geometry_filter: Dict with geometry, geometryType, spatialRel.
+            page_size: Features per page.
+
+        Yields:
+            Non-empty GeoDataFrames in EPSG:4269.
+
+        Raises:
+            requests.HTTPError: If a page request fails.
+        """
+        found = self.object_ids(url, where, geometry_filter)
+        if found is None:
+            yield from self._query_pages_serial(
+                url, where, out_fields, geometry_filter, page_size,
+            )
+            return
+        oid_field, ids = found
+
+        def fetch(window: list[int]) -> gpd.GeoDataFrame:
+            window_where = (
+                f"({where}) AND {oid_field} >= {window[0]} "
+                f"AND {oid_field} <= {window[-1]}"
+            )
+            return self.query(url, window_where, out_fields, geometry_filter)
+
+        # Keep a bounded window of pages in flight so fetching overlaps
+        # with the caller's transform/write of earlier pages without
+        # buffering the whole layer in memory
+        windows = (
+            ids[start:start + page_size]
+            for start in range(0, len(ids), page_size)
+        )
+        prefetch = 2 * self._max_workers
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            pending: deque[Future[gpd.GeoDataFrame]] = deque(
+                executor.submit(fetch, window)
+                for window in itertools.islice(windows, prefetch)
+            )
+            while pending:
+                page = pending.popleft().result()
+                window = next(windows, None)
+                if window is not None:
+                    pending.append(executor.submit(fetch, window))
+                if not page.empty:
+                    yield page
+
+    def layer_digest(
+        self,
+        url: str,
+        where: str = "1=1",
+        geometry_filter: dict[str, Any] | None = None,
+    ) -> str | None:
+        """Fingerprint a layer query from the service's last edit date.
+
+        Hashes the layer's ``editingInfo.lastEditDate`` together with the
+        query filters, so the digest changes when the source is edited or
+        the study-area envelope moves. Costs one small metadata request.
+
+        Args:
+            url: Full URL to the layer (including layer ID).
+            where: SQL WHERE clause for attribute filtering.
+            geometry_filter: Dict with geometry, geometryType, spatialRel.
+
+        Returns:
+            Hex SHA-256 digest, or None if the layer does not report a
+            last edit date (callers must then always reload).
+        """
+        try:
+            response = self._session.get(
+                url, params={"f": "json"}, timeout=self._timeout,
+            )
+            response.raise_for_status()
+            last_edit = response.json()["editingInfo"]["lastEditDate"]
+        except (requests.RequestException, KeyError, TypeError, ValueError):
+            logger.info("No last edit date for %s; change detection off", url)
+            return None
+        state = json.dumps(
+            [url, where, geometry_filter, last_edit], sort_keys=True,
+        )
+        return hashlib.sha256(state.encode()).hexdigest()
+
+    def _query_pages_serial(
+        self,
+        url: str,
+        where: str,
+        out_fields: str,
+        geometry_filter: dict[str, Any] | None,
+        page_size: int,
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Fetch pages one at a time until an empty or short page."""
+        offset = 0
+        while True:
+            page = self.query(
+                url, where, out_fields, geometry_filter, offset, page_size,
+            )
+            if page.empty:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            offset += page_size
 
     def _build_params(
         self,
@@ -207,6 +466,8 @@ class ArcGISFeatureClient:
             "where": where,
             "outFields": out_fields,
             "outSR": 4269,
+            "returnGeometry": "true",
+            "geometryPrecision": ARCGIS_GEOMETRY_PRECISION,
             "f": "geojson",
         }
         if geometry_filter:
@@ -219,16 +480,47 @@ class ArcGISFeatureClient:
 
 
 class PostGISWriter:
-    """Writes geospatial data to PostGIS via SQLAlchemy."""
+    """Writes geospatial data to PostGIS via SQLAlchemy.
 
-    def __init__(self, engine: Engine) -> None:
+    Args:
+        engine: SQLAlchemy engine connected to PostGIS.
+        batch_size: Maximum rows sent per ``COPY`` statement.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> None:
         self._engine = engine
+        self._batch_size = batch_size
+
+    @contextlib.contextmanager
+    def _begin_bulk(self) -> Iterator[Connection]:
+        """Begin a transaction with ``_BULK_SETTINGS_SQL`` applied.
+
+        ``SET LOCAL`` scopes the settings to this transaction, so only
+        merges and bulk statements get the larger memory budget, never
+        small writes such as layer digests or run tracking.
+        """
+        with self._engine.begin() as conn:
+            conn.execute(_BULK_SETTINGS_SQL)
+            yield conn
+
+    def _read_connection(self) -> Connection:
+        """Return a pooled connection in autocommit mode for read-only queries.
+
+        Skips the implicit ``BEGIN`` and the rollback on close that a
+        transactional connection would send around a single ``SELECT``.
+        """
+        return self._engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT",
+        )
 
     def truncate(self, schema: str, table: str) -> None:
         """Truncate a table, cascading to dependents."""
-        with self._engine.connect() as conn:
-            conn.execute(text(f"TRUNCATE TABLE {schema}.{table} CASCADE"))  # noqa: S608
-            conn.commit()
+        with self._engine.begin() as conn:
+            conn.execute(_render_sql(_TRUNCATE_SQL, schema=schema, table=table))
 
     def write(
         self,
@@ -236,18 +528,39 @@ class PostGISWriter:
         table: str,
         schema: str,
     ) -> None:
-        """Append a GeoDataFrame to a PostGIS table."""
-        gdf.to_postgis(
-            table, self._engine, schema=schema,
-            if_exists="append", index=False,
-        )
+        """Append a GeoDataFrame to a PostGIS table via ``COPY``."""
+        with self._engine.begin() as conn:
+            self._copy_frame(conn, gdf, f"{schema}.{table}")
         logger.info("Wrote %d rows to %s.%s", len(gdf), schema, table)
 
+    def _copy_frame(
+        self,
+        conn: Connection,
+        gdf: gpd.GeoDataFrame,
+        target: str,
+    ) -> None:
+        """Stream a GeoDataFrame into ``target`` with ``COPY ... FROM STDIN``.
+
+        Runs on the DBAPI cursor of ``conn`` so the copy participates in
+        the caller's transaction. Geometries are encoded once for the whole
+        frame; rows are then sent in ``batch_size`` slices to bound the
+        size of each serialized buffer.
+        """
+        cols = ", ".join(gdf.columns)
+        copy_sql = (
+            f"COPY {target} ({cols}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+        )
+        frame = _encode_geometry(gdf)
+        with conn.connection.cursor() as cursor:
+            for start in range(0, len(frame), self._batch_size):
+                chunk = frame.iloc[start:start + self._batch_size]
+                cursor.copy_expert(copy_sql, _to_copy_buffer(chunk))
+
     def execute(self, sql: Any, params: dict[str, Any] | None = None) -> int:
-        """Execute a SQL statement and return affected row count."""
-        with self._engine.connect() as conn:
+        """Execute a bulk SQL statement and return affected row count."""
+        with self._begin_bulk() as conn:
             result = conn.execute(sql, params or {})
-            conn.commit()
         return result.rowcount
 
     def get_watershed_envelope(self, huc8: str) -> dict[str, Any]:
@@ -262,13 +575,8 @@ class PostGISWriter:
         Raises:
             RuntimeError: If no watershed is found for the given HUC8.
         """
-        query = text(
-            "SELECT ST_XMin(geom) AS xmin, ST_YMin(geom) AS ymin, "
-            "ST_XMax(geom) AS xmax, ST_YMax(geom) AS ymax "
-            "FROM bronze.watersheds WHERE huc8 = :huc8 LIMIT 1"
-        )
-        with self._engine.connect() as conn:
-            row = conn.execute(query, {"huc8": huc8}).fetchone()
+        with self._read_connection() as conn:
+            row = conn.execute(_ENVELOPE_SQL, {"huc8": huc8}).fetchone()
         if row is None:
             raise RuntimeError(f"No watershed found for HUC8 {huc8}")
 
@@ -286,72 +594,147 @@ class PostGISWriter:
         schema: str,
         conflict_column: str,
         update_columns: list[str],
+        repair_geometry: bool = False,
     ) -> tuple[int, int]:
-        """Upsert a GeoDataFrame using a staging table + ON CONFLICT.
+        """Upsert a GeoDataFrame via a COPY-loaded staging table.
+
+        Merges with a separate ``UPDATE ... FROM`` and ``INSERT ... WHERE
+        NOT EXISTS`` rather than ``ON CONFLICT``, which avoids per-row
+        conflict checks and rewriting rows that did not change.
 
         Args:
             gdf: Data to upsert.
             table: Target table name.
             schema: Target schema name.
             conflict_column: Column with UNIQUE constraint for conflict detection.
-            update_columns: Columns to update on conflict.
+            update_columns: Columns to compare and update on existing rows.
+            repair_geometry: Make invalid staged geometries valid before
+                the merge compares them (MultiPolygon tables only).
 
         Returns:
-            Tuple of (rows inserted, rows updated).
+            Tuple of (rows inserted, rows updated). Existing rows with no
+            changed columns count as neither.
         """
-        staging = f"_staging_{table}"
-
-        # Write to staging table (replace if exists)
-        gdf.to_postgis(
-            staging, self._engine, schema=schema,
-            if_exists="replace", index=False,
+        fields = {
+            "schema": schema,
+            "table": table,
+            "staging": f"_staging_{table}",
+            "cols": ", ".join(gdf.columns),
+            "key": conflict_column,
+        }
+        set_clause = ", ".join(f"{col} = s.{col}" for col in update_columns)
+        target_row = ", ".join(f"t.{col}" for col in update_columns)
+        staged_row = ", ".join(f"s.{col}" for col in update_columns)
+
+        create_sql = _render_sql(_CREATE_STAGING_SQL, **fields)
+        index_sql = _render_sql(_INDEX_STAGING_SQL, **fields)
+        analyze_sql = _render_sql(_ANALYZE_STAGING_SQL, **fields)
+        update_sql = _render_sql(
+            _MERGE_UPDATE_SQL, **fields, set_clause=set_clause,
+            target_row=target_row, staged_row=staged_row,
         )
+        insert_sql = _render_sql(_MERGE_INSERT_SQL, **fields)
+
+        # Stage and merge in a single transaction
+        with self._begin_bulk() as conn:
+            conn.execute(create_sql)
+            self._copy_frame(conn, gdf, fields["staging"])
+            if repair_geometry:
+                self._repair_staged_geometry(conn, fields["staging"])
+            conn.execute(index_sql)
+            conn.execute(analyze_sql)
+            updated = conn.execute(update_sql).rowcount
+            inserted = conn.execute(insert_sql).rowcount
 
-        # Deduplicate staging table — keep last row per conflict key
-        # (ON CONFLICT cannot update the same row twice in one command)
-        dedup_sql = text(f"""
-            DELETE FROM {schema}.{staging} a
-            USING {schema}.{staging} b
-            WHERE a.ctid < b.ctid
-            AND a.{conflict_column} = b.{conflict_column}
-        """)  # noqa: S608
-        with self._engine.connect() as conn:
-            conn.execute(dedup_sql)
-            conn.commit()
-
-        cols = ", ".join(gdf.columns)
-        set_clause = ", ".join(
-            f"{col} = EXCLUDED.{col}" for col in update_columns
-        )
-        set_clause += ", imported_at = now()"
-
-        upsert_sql = text(f"""
-            WITH upsert_result AS (
-                INSERT INTO {schema}.{table} ({cols})
-                SELECT {cols} FROM {schema}.{staging}
-                ON CONFLICT ({conflict_column}) DO UPDATE
-                SET {set_clause}
-                RETURNING (xmax = 0) AS inserted
-            )
-            SELECT
-                COUNT(*) FILTER (WHERE inserted) AS insert_count,
-                COUNT(*) FILTER (WHERE NOT inserted) AS update_count
-            FROM upsert_result
-        """)  # noqa: S608
-
-        with self._engine.connect() as conn:
-            result = conn.execute(upsert_sql).fetchone()
-            conn.execute(text(f"DROP TABLE IF EXISTS {schema}.{staging}"))  # noqa: S608
-            conn.commit()
-
-        inserted = result[0] if result else 0
-        updated = result[1] if result else 0
         logger.info(
             "Upserted %s.%s: %d inserted, %d updated",
             schema, table, inserted, updated,
         )
         return (inserted, updated)
 
+    def append_ignore_conflicts(
+        self,
+        gdf: gpd.GeoDataFrame,
+        table: str,
+        schema: str,
+        conflict_column: str,
+        repair_geometry: bool = False,
+    ) -> int:
+        """Append a GeoDataFrame, skipping rows whose key already exists.
+
+        Rows are COPY-loaded into a temp staging table and inserted with
+        ``ON CONFLICT DO NOTHING``, so duplicates within the frame or
+        against earlier batches are resolved by the table's UNIQUE
+        constraint. Rows with a null key are dropped.
+
+        Args:
+            gdf: Data to append.
+            table: Target table name.
+            schema: Target schema name.
+            conflict_column: Column with UNIQUE constraint.
+            repair_geometry: Make invalid staged geometries valid before
+                inserting them (MultiPolygon tables only).
+
+        Returns:
+            Number of rows inserted.
+        """
+        fields = {
+            "schema": schema,
+            "table": table,
+            "staging": f"_staging_{table}",
+            "cols": ", ".join(gdf.columns),
+            "key": conflict_column,
+        }
+        create_sql = _render_sql(_CREATE_STAGING_SQL, **fields)
+        insert_sql = _render_sql(_INSERT_IGNORE_SQL, **fields)
+
+        with self._engine.begin() as conn:
+            conn.execute(create_sql)
+            self._copy_frame(conn, gdf, fields["staging"])
+            if repair_geometry:
+                self._repair_staged_geometry(conn, fields["staging"])
+            inserted = conn.execute(insert_sql).rowcount
+
+        logger.info(
+            "Appended %d of %d rows to %s.%s",
+            inserted, len(gdf), schema, table,
+        )
+        return inserted
+
+    def _repair_staged_geometry(self, conn: Connection, staging: str) -> None:
+        """Rewrite invalid polygons in a staging table with ST_MakeValid.
+
+        Self-intersecting rings make GEOS fall back to slow paths or raise
+        TopologyException inside the compliance ST_Intersection. Repairing
+        in staging, before the merge, means the stored geometry always
+        equals the repaired source, so unchanged rows stay unchanged.
+        """
+        repaired = conn.execute(
+            _render_sql(_REPAIR_STAGING_SQL, staging=staging),
+        ).rowcount
+        if repaired:
+            logger.info("Repaired %d invalid geometries in %s", repaired, staging)
+
+    def get_layer_digest(self, layer: str) -> str | None:
+        """Return the digest stored in meta.layer_state for ``layer``."""
+        with self._read_connection() as conn:
+            row = conn.execute(
+                _GET_LAYER_DIGEST_SQL, {"layer": layer},
+            ).fetchone()
+        return None if row is None else row.digest
+
+    def set_layer_digest(self, layer: str, digest: str) -> None:
+        """Upsert the digest of a successfully loaded layer."""
+        with self._engine.begin() as conn:
+            conn.execute(
+                _SET_LAYER_DIGEST_SQL, {"layer": layer, "digest": digest},
+            )
+
+    def clear_layer_digests(self) -> None:
+        """Delete every row of meta.layer_state."""
+        with self._engine.begin() as conn:
+            conn.execute(_CLEAR_LAYER_DIGESTS_SQL)
+
 
 # ---------------------------------------------------------------------------
 # Pure helpers (no I/O, always testable)
@@ -366,13 +749,65 @@ def _coerce_int_columns(
 
     ArcGIS GeoJSON returns all numbers as floats (e.g. 1.0 instead of 1).
     """
-    import pandas as pd
-    for col in cols:
-        if col in gdf.columns:
-            gdf[col] = pd.to_numeric(gdf[col], errors="coerce").astype("Int64")
+    present = [col for col in cols if col in gdf.columns]
+    if present:
+        block = gdf[present].apply(pd.to_numeric, errors="coerce")
+        gdf[present] = block.astype("Int64")
     return gdf
 
 
+def _features_to_frame(features: list[dict[str, Any]]) -> gpd.GeoDataFrame:
+    """Build a GeoDataFrame from GeoJSON features in one vectorized pass.
+
+    Geometries are parsed by ``shapely.from_geojson`` in a single GEOS
+    call and attributes are built column-wise, avoiding the per-feature
+    ``shape()`` and dict handling of ``GeoDataFrame.from_features``.
+
+    Args:
+        features: GeoJSON feature dicts from an ArcGIS ``f=geojson`` query.
+
+    Returns:
+        GeoDataFrame in EPSG:4269.
+    """
+    geometries = shapely.from_geojson([
+        None if f.get("geometry") is None else json.dumps(f["geometry"])
+        for f in features
+    ])
+    attributes = pd.DataFrame.from_records(
+        [f.get("properties") or {} for f in features],
+    )
+    return gpd.GeoDataFrame(attributes, geometry=geometries, crs="EPSG:4269")
+
+
+def _encode_geometry(gdf: gpd.GeoDataFrame) -> pd.DataFrame:
+    """Replace the geometry column with hex EWKB in a single vectorized pass.
+
+    PostGIS parses hex EWKB directly into ``geometry`` columns, so the
+    result can be streamed with text-format ``COPY``.
+    """
+    geom_col = gdf.geometry.name
+    srid = gdf.crs.to_epsg() if gdf.crs is not None else None
+    geoms = gdf.geometry.to_numpy()
+    if srid is not None:
+        geoms = shapely.set_srid(geoms, srid)
+
+    frame = pd.DataFrame(gdf)
+    frame[geom_col] = shapely.to_wkb(geoms, hex=True, include_srid=True)
+    return frame
+
+
+def _to_copy_buffer(frame: pd.DataFrame) -> io.StringIO:
+    """Serialize an encoded frame as CSV for ``COPY ... FROM STDIN``.
+
+    Nulls are written as ``_COPY_NULL``, so empty strings stay empty
+    strings instead of loading as NULL.
+    """
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False, header=False, na_rep=_COPY_NULL)
+    buffer.seek(0)
+    return buffer
+
+
 def rename_and_prepare(
     gdf: gpd.GeoDataFrame,
     col_map: dict[str, str],
@@ -390,7 +825,82 @@ def rename_and_prepare(
     keep = [c for c in col_map.values() if c in gdf.columns] + ["geometry"]
     gdf = gdf[[c for c in keep if c in gdf.columns]]
     gdf = gdf.rename_geometry("geom")
-    return gdf.to_crs(STORAGE_CRS)
+    if gdf.crs is None:
+        raise ValueError("Cannot reproject a GeoDataFrame without a CRS")
+    # ArcGIS queries already request outSR=4269; skip the no-op reprojection
+    if gdf.crs.equals(STORAGE_CRS):
+        return gdf
+    geoms = _bulk_reproject(gdf.geometry.to_numpy(), gdf.crs, STORAGE_CRS)
+    return gpd.GeoDataFrame(
+        gdf.drop(columns="geom"),
+        geometry=gpd.GeoSeries(geoms, index=gdf.index, name="geom"),
+        crs=STORAGE_CRS,
+    )
+
+
+def _normalize_layer(
+    gdf: gpd.GeoDataFrame,
+    col_map: dict[str, str],
+    int_cols: list[str] | None = None,
+    explode: bool = False,
+) -> gpd.GeoDataFrame:
+    """Rename, coerce, and optionally explode a fetched layer in one pass.
+
+    Integer coercion runs before exploding so it touches one row per
+    source feature. Multi-part geometries are split with a single
+    ``take`` of the attribute rows instead of ``GeoDataFrame.explode``,
+    which builds and then discards a MultiIndex.
+
+    Args:
+        gdf: Source GeoDataFrame as returned by the feature client.
+        col_map: Mapping of source column names to target column names.
+        int_cols: Columns to coerce from float to Int64.
+        explode: Whether to split multi-part geometries into rows.
+
+    Returns:
+        GeoDataFrame with geom column in EPSG:4269 and a fresh RangeIndex.
+    """
+    gdf = rename_and_prepare(gdf, col_map)
+    if int_cols:
+        gdf = _coerce_int_columns(gdf, int_cols)
+    if not explode:
+        return gdf
+
+    parts, source_idx = shapely.get_parts(
+        gdf.geometry.to_numpy(), return_index=True,
+    )
+    attrs = gdf.drop(columns="geom").iloc[source_idx].reset_index(drop=True)
+    return gpd.GeoDataFrame(
+        attrs,
+        geometry=gpd.GeoSeries(parts, name="geom"),
+        crs=gdf.crs,
+    )
+
+
+def _bulk_reproject(
+    geoms: np.ndarray,
+    src_crs: Any,
+    dst_crs: Any,
+) -> np.ndarray:
+    """Reproject a geometry array with a single pyproj call.
+
+    ``shapely.transform`` hands every coordinate of the array to the
+    transformer at once, so the per-call pyproj overhead is paid once per
+    batch rather than once per geometry.
+    """
+    transformer = _get_transformer(src_crs, dst_crs)
+
+    def project(coords: np.ndarray) -> np.ndarray:
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([x, y])
+
+    return shapely.transform(geoms, project)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_transformer(src_crs: Any, dst_crs: Any) -> Transformer:
+    """Build (once per CRS pair) a thread-safe pyproj Transformer."""
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
 
 
 # ---------------------------------------------------------------------------
@@ -416,13 +926,45 @@ class EtlPipeline:
     ) -> None:
         self._client = client
         self._writer = writer
+        self._envelope: dict[str, Any] | None = None
+
+    def _get_envelope(self) -> dict[str, Any]:
+        """Return the study-area envelope, querying it once per pipeline."""
+        if self._envelope is None:
+            self._envelope = self._writer.get_watershed_envelope(HUC8_CODE)
+        return self._envelope
 
     # -- Bronze layer -------------------------------------------------------
 
-    def load_watershed(self) -> None:
-        """Load the San Juan Basin (HUC8 14080101) watershed boundary."""
+    def load_watershed(self) -> LayerChangeResult:
+        """Load the San Juan Basin (HUC8 14080101) watershed boundary.
+
+        The row is upserted by HUC8 rather than truncated and rewritten,
+        so it keeps its ``id`` and the CASCADE never reaches
+        gold.riparian_summary; both full and incremental runs can then
+        refresh the summary in place.
+
+        Returns:
+            LayerChangeResult for the watershed row.
+        """
         logger.info("Loading watershed boundary for HUC8 %s", HUC8_CODE)
+        gdf = self._fetch_watershed()
+        inserted, updated = self._writer.upsert(
+            gdf, "watersheds", "bronze", conflict_column="huc8",
+            update_columns=["name", "area_sq_km", "states", "geom"],
+        )
+        self._envelope = None
+        logger.info("Finished loading watershed boundary")
+        return LayerChangeResult(
+            "watersheds", inserted, updated, len(gdf) - inserted - updated,
+        )
+
+    def _fetch_watershed(self) -> gpd.GeoDataFrame:
+        """Fetch and rename the study-area watershed boundary.
 
+        Raises:
+            RuntimeError: If the service returns no watershed.
+        """
         gdf = self._client.query(
             url=WATERSHED_URL,
             where=f"HUC8='{HUC8_CODE}'",
@@ -431,13 +973,10 @@ class EtlPipeline:
         if gdf.empty:
             raise RuntimeError(f"No watershed found for HUC8 {HUC8_CODE}")
 
-        gdf = rename_and_prepare(gdf, {
+        return rename_and_prepare(gdf, {
             "HUC8": "huc8", "NAME": "name",
             "AREASQKM": "area_sq_km", "STATES": "states",
         })
-        self._writer.truncate("bronze", "watersheds")
-        self._writer.write(gdf, "watersheds", "bronze")
-        logger.info("Finished loading watershed boundary")
 
     def load_nhdplus_layers(self) -> None:
         """Load NHDPlus V2.1 streams, waterbodies, and sinks.
@@ -446,7 +985,7 @@ class EtlPipeline:
         results to the study area.
         """
         logger.info("Loading NHDPlus layers")
-        envelope = self._writer.get_watershed_envelope(HUC8_CODE)
+        envelope = self._get_envelope()
 
         self._load_layer(
             name="streams", schema="bronze",
@@ -482,6 +1021,7 @@ class EtlPipeline:
                     "SINKID": "comid", "PURPDESC": "gnis_name",
                     "PURPCODE": "ftype", "GridCode": "fcode",
                 },
+                int_cols=["comid", "fcode"],
             )
         except Exception:
             logger.warning("Sinks layer could not be loaded — skipping (non-critical)")
@@ -501,83 +1041,123 @@ class EtlPipeline:
         """Fetch, transform, and write a single feature layer."""
         logger.info("Loading %s", name)
 
-        gdf = self._client.query(
-            url=url, where=where, geometry_filter=envelope,
+        gdf = self._fetch_layer(
+            name, url, col_map, envelope, where, explode, int_cols,
         )
-        if gdf.empty:
-            logger.warning("No %s found in study area", name)
+        if gdf is None:
             return
 
-        gdf = rename_and_prepare(gdf, col_map)
-        if int_cols:
-            gdf = _coerce_int_columns(gdf, int_cols)
-        if explode:
-            gdf = gdf.explode(index_parts=False).reset_index(drop=True)
-
         self._writer.truncate(schema, name)
         self._writer.write(gdf, name, schema)
         logger.info("Finished loading %d %s", len(gdf), name)
 
+    def _fetch_layer(
+        self,
+        name: str,
+        url: str,
+        col_map: dict[str, str],
+        envelope: dict[str, Any] | None,
+        where: str,
+        explode: bool,
+        int_cols: list[str] | None,
+    ) -> gpd.GeoDataFrame | None:
+        """Fetch and normalize a feature layer for either load path.
+
+        Shared by ``_load_layer`` and ``_load_layer_incremental``, which
+        differ only in how the result is written.
+
+        Returns:
+            Normalized GeoDataFrame, or None if the layer has no features
+            in the study area.
+        """
+        gdf = self._fetch_all_pages(url, where, ",".join(col_map), envelope)
+        if gdf.empty:
+            logger.warning("No %s found in study area", name)
+            return None
+        return _normalize_layer(gdf, col_map, int_cols, explode)
+
+    def _fetch_all_pages(
+        self,
+        url: str,
+        where: str,
+        out_fields: str,
+        envelope: dict[str, Any] | None,
+    ) -> gpd.GeoDataFrame:
+        """Fetch every page of a layer and concatenate them into one frame.
+
+        Pages are fetched concurrently through ``FeatureClient.query_pages``
+        so layers larger than the server's ``maxRecordCount`` are not
+        truncated.
+        """
+        pages = list(self._client.query_pages(
+            url=url, where=where, out_fields=out_fields,
+            geometry_filter=envelope, page_size=ARCGIS_BATCH_SIZE,
+        ))
+        if not pages:
+            return gpd.GeoDataFrame()
+        if len(pages) == 1:
+            return pages[0]
+        return gpd.GeoDataFrame(
+            pd.concat(pages, ignore_index=True), crs=pages[0].crs,
+        )
+
     def load_parcels(self) -> None:
         """Load Colorado parcels with pagination and field renaming.
 
-        Paginates through the ArcGIS REST API in batches and applies
+        Fetches ArcGIS REST API pages concurrently and applies
         the field renaming documented in CLAUDE.md:
         landUseDsc -> land_use_desc, landUseCde -> land_use_code,
         zoningDesc -> zoning_desc, owner -> owner_name,
         landAcres -> land_acres.
         """
         logger.info("Loading parcels with pagination")
-        envelope = self._writer.get_watershed_envelope(HUC8_CODE)
+        envelope = self._get_envelope()
         self._writer.truncate("bronze", "parcels")
 
         source_fields = ",".join(PARCEL_FIELD_MAP.keys())
-        offset = 0
         total = 0
-        seen_ids: set[str] = set()
-
-        while True:
-            gdf = self._client.query(
-                url=PARCELS_URL,
-                out_fields=source_fields,
-                geometry_filter=envelope,
-                result_offset=offset,
-                result_record_count=ARCGIS_BATCH_SIZE,
-            )
-            if gdf.empty:
-                break
 
+        for gdf in self._client.query_pages(
+            url=PARCELS_URL,
+            where=PARCELS_WHERE,
+            out_fields=source_fields,
+            geometry_filter=envelope,
+            page_size=ARCGIS_BATCH_SIZE,
+        ):
             gdf = rename_and_prepare(gdf, PARCEL_FIELD_MAP)
-            # Drop rows missing required parcel_id
-            before = len(gdf)
-            gdf = gdf.dropna(subset=["parcel_id"])
-            if len(gdf) < before:
-                logger.info("Dropped %d parcels with null parcel_id", before - len(gdf))
-            # Deduplicate within batch and across batches
-            gdf = gdf.drop_duplicates(subset=["parcel_id"], keep="first")
-            gdf = gdf[~gdf["parcel_id"].isin(seen_ids)]
-            if gdf.empty:
-                continue
-            seen_ids.update(gdf["parcel_id"].tolist())
-            self._writer.write(gdf, "parcels", "bronze")
-
-            batch_count = len(gdf)
+            # Duplicate parcel_ids (within and across batches) are dropped
+            # by the uq_parcels_parcel_id constraint
+            batch_count = self._writer.append_ignore_conflicts(
+                gdf, "parcels", "bronze", conflict_column="parcel_id",
+                repair_geometry=True,
+            )
             total += batch_count
-            offset += ARCGIS_BATCH_SIZE
             logger.info(
                 "Loaded parcel batch: %d (total: %d)", batch_count, total,
             )
-            if batch_count < ARCGIS_BATCH_SIZE:
-                break
 
         logger.info("Finished loading %d parcels", total)
+        self._cluster_by_geometry("bronze", "parcels", "idx_parcels_geom")
+
+    def _cluster_by_geometry(self, schema: str, table: str, index: str) -> None:
+        """Physically order a freshly loaded table by its GiST index.
+
+        Clustering keeps spatially adjacent rows on adjacent heap pages,
+        so the ``&&`` pre-filter in the compliance join reads far fewer
+        pages. ANALYZE refreshes planner statistics after the rewrite.
+        """
+        fields = {"schema": schema, "table": table, "index": index}
+        self._writer.execute(_render_sql(_CLUSTER_SQL, **fields))
+        self._writer.execute(_render_sql(_ANALYZE_SQL, **fields))
+        logger.info("Clustered %s.%s on %s", schema, table, index)
 
     # -- Silver layer -------------------------------------------------------
 
     def generate_buffers(
         self,
         buffer_distance_m: float = DEFAULT_BUFFER_DISTANCE_M,
-    ) -> None:
+        changed_only: bool = False,
+    ) -> int:
         """Generate riparian buffer polygons around stream centerlines.
 
         Uses ST_Buffer on geography type for meter-accurate distances.
@@ -585,18 +1165,50 @@ class EtlPipeline:
 
         Args:
             buffer_distance_m: Buffer width in meters.
+            changed_only: Rebuild only buffers of new streams or streams
+                whose geometry changed since the buffer was processed,
+                instead of truncating and regenerating every buffer.
+
+        Returns:
+            Number of buffers generated.
         """
         logger.info(
             "Generating riparian buffers (%.1f m / %.0f ft)",
             buffer_distance_m,
             buffer_distance_m * 3.28084,
         )
+        if changed_only:
+            return self._regenerate_stale_buffers(buffer_distance_m)
+
         self._writer.truncate("silver", "riparian_buffers")
         count = self._writer.execute(
             _GENERATE_BUFFERS_SQL,
             {"buffer_distance": buffer_distance_m},
         )
         logger.info("Generated %d riparian buffers", count)
+        self._cluster_by_geometry(
+            "silver", "riparian_buffers", "idx_riparian_buffers_geom",
+        )
+        return count
+
+    def _regenerate_stale_buffers(self, buffer_distance_m: float) -> int:
+        """Replace buffers of changed streams and add buffers for new ones.
+
+        A buffer is stale when its stream's geometry changed (checked only
+        for streams whose ``imported_at`` is newer than the buffer's
+        ``processed_at``), or when it was built with a different distance.
+        Dependent compliance and NDVI rows are deleted with it, since they
+        describe the old geometry; the next incremental NDVI run backfills
+        the new buffer. All other NDVI history is kept.
+        """
+        params = {"buffer_distance": buffer_distance_m}
+        stale = self._writer.execute(_DELETE_STALE_BUFFERS_SQL, params)
+        self._writer.execute(_TOUCH_CHECKED_BUFFERS_SQL)
+        if stale:
+            logger.info("Removed %d stale riparian buffers", stale)
+        count = self._writer.execute(_GENERATE_MISSING_BUFFERS_SQL, params)
+        logger.info("Regenerated %d riparian buffers for changed streams", count)
+        return count
 
     def analyze_compliance(self) -> None:
         """Flag parcels that encroach on riparian buffer zones.
@@ -617,10 +1229,10 @@ class EtlPipeline:
 
         Aggregates stream lengths, buffer areas, and parcel compliance
         rates using CTEs. NDVI vegetation health fields are populated
-        separately by the vegetation scoring pipeline.
+        separately by the vegetation scoring pipeline, so existing rows are
+        refreshed in place (one row per watershed) rather than truncated.
         """
         logger.info("Calculating compliance summary")
-        self._writer.truncate("gold", "riparian_summary")
         count = self._writer.execute(_CALCULATE_SUMMARY_SQL)
         logger.info("Generated %d summary records", count)
 
@@ -630,6 +1242,10 @@ class EtlPipeline:
         """Run the full pipeline: bronze -> silver -> gold."""
         logger.info("Starting Riparian Buffer Compliance ETL pipeline")
 
+        # A full reload truncates bronze first; stale digests would let a
+        # failed reload look "unchanged" to the next incremental run
+        self._writer.clear_layer_digests()
+
         # Bronze -- raw data ingestion
         self.load_watershed()
         self.load_nhdplus_layers()
@@ -674,39 +1290,49 @@ class EtlPipeline:
             int_cols: Columns to coerce from float to Int64.
 
         Returns:
-            LayerChangeResult with insert/update counts.
+            LayerChangeResult with insert/update counts and the source
+            digest to record once the run succeeds.
         """
         logger.info("Incremental load: %s", name)
 
-        gdf = self._client.query(
-            url=url, where=where, geometry_filter=envelope,
-        )
-        if gdf.empty:
-            logger.warning("No %s found in study area", name)
+        digest = self._client.layer_digest(url, where, envelope)
+        if self._layer_unchanged(name, digest):
             return LayerChangeResult(name, 0, 0, 0)
 
-        gdf = rename_and_prepare(gdf, col_map)
-        if int_cols:
-            gdf = _coerce_int_columns(gdf, int_cols)
-        if explode:
-            gdf = gdf.explode(index_parts=False).reset_index(drop=True)
+        gdf = self._fetch_layer(
+            name, url, col_map, envelope, where, explode, int_cols,
+        )
+        if gdf is None:
+            return LayerChangeResult(name, 0, 0, 0)
 
         inserted, updated = self._writer.upsert(
             gdf, name, schema, conflict_column, update_columns,
         )
         skipped = len(gdf) - inserted - updated
-        return LayerChangeResult(name, inserted, updated, skipped)
+        digests = () if digest is None else ((name, digest),)
+        return LayerChangeResult(name, inserted, updated, skipped, digests)
+
+    def _layer_unchanged(self, name: str, digest: str | None) -> bool:
+        """Return True if ``digest`` matches the last successful load."""
+        if digest is None or digest != self._writer.get_layer_digest(name):
+            return False
+        logger.info("Source for %s unchanged since last load; skipping", name)
+        return True
 
     def load_nhdplus_layers_incremental(self) -> LayerChangeResult:
         """Incrementally upsert NHDPlus streams and waterbodies.
 
+        The two layers target different tables, so they are fetched and
+        merged concurrently rather than one after the other.
+
         Returns:
             Combined LayerChangeResult (has_changes if any layer changed).
         """
         logger.info("Incremental loading NHDPlus layers")
-        envelope = self._writer.get_watershed_envelope(HUC8_CODE)
+        envelope = self._get_envelope()
 
-        streams = self._load_layer_incremental(
+        load_streams = functools.partial(
+            self._load_layer_incremental,
             name="streams", schema="bronze",
             url=f"{NHDPLUS_URL}/{NHDPLUS_FLOWLINE_LAYER}",
             envelope=envelope, explode=True,
@@ -721,7 +1347,8 @@ class EtlPipeline:
                             "fcode", "stream_order", "length_km", "geom"],
             int_cols=["comid", "fcode", "stream_order"],
         )
-        waterbodies = self._load_layer_incremental(
+        load_waterbodies = functools.partial(
+            self._load_layer_incremental,
             name="waterbodies", schema="bronze",
             url=f"{NHDPLUS_URL}/{NHDPLUS_WATERBODY_LAYER}",
             envelope=envelope, explode=True,
@@ -735,11 +1362,18 @@ class EtlPipeline:
                             "area_sq_km", "geom"],
             int_cols=["comid", "fcode"],
         )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            streams_future = executor.submit(load_streams)
+            waterbodies_future = executor.submit(load_waterbodies)
+            streams = streams_future.result()
+            waterbodies = waterbodies_future.result()
+
         total = LayerChangeResult(
             "nhdplus",
             streams.inserted + waterbodies.inserted,
             streams.updated + waterbodies.updated,
             streams.skipped + waterbodies.skipped,
+            streams.digests + waterbodies.digests,
         )
         logger.info("Finished incremental NHDPlus: %s", total)
         return total
@@ -751,29 +1385,28 @@ class EtlPipeline:
             LayerChangeResult with total insert/update counts.
         """
         logger.info("Incremental loading parcels")
-        envelope = self._writer.get_watershed_envelope(HUC8_CODE)
+        envelope = self._get_envelope()
+
+        digest = self._client.layer_digest(PARCELS_URL, PARCELS_WHERE, envelope)
+        if self._layer_unchanged("parcels", digest):
+            return LayerChangeResult("parcels", 0, 0, 0)
 
         source_fields = ",".join(PARCEL_FIELD_MAP.keys())
-        offset = 0
         total_inserted = 0
         total_updated = 0
         total_skipped = 0
 
-        while True:
-            gdf = self._client.query(
-                url=PARCELS_URL,
-                out_fields=source_fields,
-                geometry_filter=envelope,
-                result_offset=offset,
-                result_record_count=ARCGIS_BATCH_SIZE,
-            )
-            if gdf.empty:
-                break
-
+        for gdf in self._client.query_pages(
+            url=PARCELS_URL,
+            where=PARCELS_WHERE,
+            out_fields=source_fields,
+            geometry_filter=envelope,
+            page_size=ARCGIS_BATCH_SIZE,
+        ):
             gdf = rename_and_prepare(gdf, PARCEL_FIELD_MAP)
+            # Defensive: PARCELS_WHERE already excludes null parcel_ids
             gdf = gdf.dropna(subset=["parcel_id"])
             if gdf.empty:
-                offset += ARCGIS_BATCH_SIZE
                 continue
 
             inserted, updated = self._writer.upsert(
@@ -782,17 +1415,15 @@ class EtlPipeline:
                 update_columns=["land_use_desc", "land_use_code",
                                 "zoning_desc", "owner_name",
                                 "land_acres", "geom"],
+                repair_geometry=True,
             )
             total_inserted += inserted
             total_updated += updated
             total_skipped += len(gdf) - inserted - updated
 
-            offset += ARCGIS_BATCH_SIZE
-            if len(gdf) < ARCGIS_BATCH_SIZE:
-                break
-
         result = LayerChangeResult(
             "parcels", total_inserted, total_updated, total_skipped,
+            () if digest is None else (("parcels", digest),),
         )
         logger.info("Finished incremental parcels: %s", result)
         return result
@@ -805,29 +1436,43 @@ class EtlPipeline:
         """
         logger.info("Starting incremental ETL pipeline")
 
-        # Bronze -- upsert (watershed always full refresh, only 1 record)
-        self.load_watershed()
-        nhdplus_result = self.load_nhdplus_layers_incremental()
-        parcels_result = self.load_parcels_incremental()
+        # Bronze -- upsert. NHDPlus and parcels share no tables, so they
+        # load concurrently; the envelope is primed first so both threads
+        # reuse one query.
+        watershed_changed = self.load_watershed().has_changes
+        self._get_envelope()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            nhdplus_future = executor.submit(
+                self.load_nhdplus_layers_incremental,
+            )
+            parcels_future = executor.submit(self.load_parcels_incremental)
+            nhdplus_result = nhdplus_future.result()
+            parcels_result = parcels_future.result()
 
         streams_changed = nhdplus_result.has_changes
         parcels_changed = parcels_result.has_changes
         buffers_changed = False
 
-        # Silver -- recompute only if upstream changed
+        # Silver -- recompute only if upstream changed, and only for the
+        # streams whose rows the upsert touched
         if streams_changed:
-            self.generate_buffers()
-            buffers_changed = True
+            buffers_changed = self.generate_buffers(changed_only=True) > 0
 
         if parcels_changed or buffers_changed:
             self.analyze_compliance()
 
-        # Gold -- recompute after any silver changes
-        if streams_changed or parcels_changed or buffers_changed:
+        # Gold -- recompute after any silver or watershed changes
+        if (watershed_changed or streams_changed or parcels_changed
+                or buffers_changed):
             self.calculate_summary()
         else:
             logger.info("No bronze changes — skipping silver/gold recompute")
 
+        # Only now is every layer fully applied; recording digests earlier
+        # would let a failed silver/gold step be skipped on the next run
+        for layer, digest in nhdplus_result.digests + parcels_result.digests:
+            self._writer.set_layer_digest(layer, digest)
+
         logger.info(
             "Incremental ETL completed: streams_changed=%s, "
             "parcels_changed=%s, buffers_changed=%s",
@@ -836,36 +1481,209 @@ class EtlPipeline:
         return (streams_changed, parcels_changed, buffers_changed)
 
 
+# ---------------------------------------------------------------------------
+# SQL templates for PostGISWriter
+# ---------------------------------------------------------------------------
+
+_ENVELOPE_SQL = text("""
+    SELECT ST_XMin(geom) AS xmin, ST_YMin(geom) AS ymin,
+           ST_XMax(geom) AS xmax, ST_YMax(geom) AS ymax
+    FROM bronze.watersheds
+    WHERE huc8 = :huc8
+    LIMIT 1
+""")
+
+_GET_LAYER_DIGEST_SQL = text("""
+    SELECT digest FROM meta.layer_state WHERE layer = :layer
+""")
+
+_SET_LAYER_DIGEST_SQL = text("""
+    INSERT INTO meta.layer_state (layer, digest, checked_at)
+    VALUES (:layer, :digest, now())
+    ON CONFLICT (layer) DO UPDATE
+    SET digest = EXCLUDED.digest, checked_at = EXCLUDED.checked_at
+""")
+
+# Transaction-scoped settings for merges and bulk statements. The
+# ETL can always be re-run from source, so commits need not wait for the
+# WAL flush; the memory settings let the large spatial joins and index
+# builds sort/hash in memory.
+_BULK_SETTINGS_SQL = text("""
+    SET LOCAL synchronous_commit = off;
+    SET LOCAL work_mem = '256MB';
+    SET LOCAL maintenance_work_mem = '1GB'
+""")
+
+_CLEAR_LAYER_DIGESTS_SQL = text("DELETE FROM meta.layer_state")
+
+# NULL marker for CSV COPY; the CSV default (an unquoted empty field) would
+# also turn empty strings into NULL
+_COPY_NULL = r"\N"
+
+# Identifiers below come from pipeline code, never from user input, and
+# are interpolated with str.format by _render_sql.
+_TRUNCATE_SQL = "TRUNCATE TABLE {schema}.{table} CASCADE"
+
+# Temp staging table with the target's column types, dropped on commit
+_CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE {staging} ON COMMIT DROP AS
+    SELECT {cols} FROM {schema}.{table} WITH NO DATA
+"""
+
+# Temp tables are never auto-analyzed; index the join key and collect
+# stats so the merge can use an index or hash join
+_INDEX_STAGING_SQL = "CREATE INDEX ON {staging} ({key})"
+_ANALYZE_STAGING_SQL = "ANALYZE {staging}"
+
+# Last staged row per conflict key (the UPDATE ... FROM must match at most
+# one staging row); a sort instead of a self-join
+_DEDUPED_STAGING = """(
+        SELECT DISTINCT ON ({key}) {cols} FROM {staging}
+        ORDER BY {key}, ctid DESC
+    )"""
+
+# Update only rows whose tracked columns actually differ
+_MERGE_UPDATE_SQL = """
+    UPDATE {schema}.{table} t
+    SET {set_clause}, imported_at = now()
+    FROM """ + _DEDUPED_STAGING + """ s
+    WHERE t.{key} = s.{key}
+    AND ({target_row}) IS DISTINCT FROM ({staged_row})
+"""
+
+_MERGE_INSERT_SQL = """
+    INSERT INTO {schema}.{table} ({cols})
+    SELECT {cols} FROM """ + _DEDUPED_STAGING + """ s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM {schema}.{table} t
+        WHERE t.{key} = s.{key}
+    )
+"""
+
+# CollectionExtract keeps only the polygonal parts, so the result still fits
+# a geometry(MultiPolygon) column
+_REPAIR_STAGING_SQL = """
+    UPDATE {staging}
+    SET geom = ST_Multi(ST_CollectionExtract(ST_MakeValid(geom), 3))
+    WHERE NOT ST_IsValid(geom)
+"""
+
+_INSERT_IGNORE_SQL = """
+    INSERT INTO {schema}.{table} ({cols})
+    SELECT {cols} FROM {staging}
+    WHERE {key} IS NOT NULL
+    ON CONFLICT ({key}) DO NOTHING
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _render_sql(template: str, **fields: str) -> TextClause:
+    """Format a SQL template and wrap it in ``text()``, once per shape.
+
+    Returning the same ``TextClause`` for repeated (template, fields)
+    combinations lets SQLAlchemy reuse its compiled form across batches.
+    """
+    return text(template.format(**fields))
+
+
 # ---------------------------------------------------------------------------
 # SQL constants for silver/gold spatial processing
 # ---------------------------------------------------------------------------
 
-_GENERATE_BUFFERS_SQL = text("""
+_GENERATE_BUFFERS_BASE = """
     INSERT INTO silver.riparian_buffers
         (stream_id, buffer_distance_m, area_sq_m, geom)
     SELECT
         s.id,
         :buffer_distance,
-        ST_Area(ST_Buffer(s.geom::geography, :buffer_distance)),
-        ST_SetSRID(
-            ST_Buffer(s.geom::geography, :buffer_distance)::geometry,
-            4269
-        )
+        ST_Area(bg.buffer),
+        ST_SetSRID(bg.buffer::geometry, 4269)
+    FROM bronze.streams s
+    -- Buffer each stream once; reused for both area and geometry
+    CROSS JOIN LATERAL (
+        SELECT ST_Buffer(s.geom::geography, :buffer_distance) AS buffer
+    ) bg
+"""
+
+_GENERATE_BUFFERS_SQL = text(_GENERATE_BUFFERS_BASE)
+
+# Incremental rebuild. Buffers of streams the upsert touched are candidates;
+# a candidate is stale only if its geometry no longer matches a fresh buffer
+# of the stream (attribute-only edits keep it), or if it was built with
+# another distance. Stale buffers go with their compliance and NDVI rows;
+# the FK checks run at end of statement, after the CTE deletes.
+_DELETE_STALE_BUFFERS_SQL = text("""
+    WITH stale AS (
+        SELECT b.id
+        FROM silver.riparian_buffers b
+        JOIN bronze.streams s ON s.id = b.stream_id
+        WHERE b.buffer_distance_m <> :buffer_distance
+           OR (
+               b.processed_at < s.imported_at
+               AND NOT ST_Equals(
+                   b.geom,
+                   ST_SetSRID(
+                       ST_Buffer(s.geom::geography, :buffer_distance)::geometry,
+                       4269
+                   )
+               )
+           )
+    ),
+    deleted_compliance AS (
+        DELETE FROM silver.parcel_compliance
+        WHERE buffer_id IN (SELECT id FROM stale)
+    ),
+    deleted_health AS (
+        DELETE FROM silver.vegetation_health
+        WHERE buffer_id IN (SELECT id FROM stale)
+    )
+    DELETE FROM silver.riparian_buffers
+    WHERE id IN (SELECT id FROM stale)
+""")
+
+# Remaining candidates were unchanged; mark them checked so later runs do
+# not re-buffer them
+_TOUCH_CHECKED_BUFFERS_SQL = text("""
+    UPDATE silver.riparian_buffers b
+    SET processed_at = now()
     FROM bronze.streams s
+    WHERE s.id = b.stream_id
+      AND b.processed_at < s.imported_at
+""")
+
+_GENERATE_MISSING_BUFFERS_SQL = text(_GENERATE_BUFFERS_BASE + """
+    WHERE NOT EXISTS (
+        SELECT 1 FROM silver.riparian_buffers b WHERE b.stream_id = s.id
+    )
 """)
 
-# Bounding-box pre-filter (&&) before expensive ST_Intersects per convention
+# Rewrite a table in GiST index order, then refresh planner statistics
+_CLUSTER_SQL = "CLUSTER {schema}.{table} USING {index}"
+_ANALYZE_SQL = "ANALYZE {schema}.{table}"
+
+# Bounding-box pre-filter (&&) before expensive ST_Intersects per convention.
+# Long stream buffers are subdivided first so each piece has a tight bbox and
+# at most 256 vertices; every piece probes the parcels GiST index, and the
+# per-piece overlaps are unioned back per (parcel, buffer).
 _ANALYZE_COMPLIANCE_SQL = text("""
-    WITH intersections AS (
+    WITH buffer_parts AS (
         SELECT
-            p.id AS parcel_id,
             b.id AS buffer_id,
             b.area_sq_m AS buffer_area_sq_m,
-            ST_Intersection(p.geom, b.geom) AS overlap_geom
-        FROM bronze.parcels p
-        JOIN silver.riparian_buffers b
-            ON p.geom && b.geom
-            AND ST_Intersects(p.geom, b.geom)
+            ST_Subdivide(b.geom, 256) AS geom
+        FROM silver.riparian_buffers b
+    ),
+    intersections AS (
+        SELECT
+            p.id AS parcel_id,
+            bp.buffer_id,
+            bp.buffer_area_sq_m,
+            ST_Union(ST_Intersection(p.geom, bp.geom)) AS overlap_geom
+        FROM buffer_parts bp
+        JOIN bronze.parcels p
+            ON p.geom && bp.geom
+            AND ST_Intersects(p.geom, bp.geom)
+        GROUP BY p.id, bp.buffer_id, bp.buffer_area_sq_m
     )
     INSERT INTO silver.parcel_compliance (
         parcel_id, buffer_id, overlap_area_sq_m, overlap_pct,
@@ -885,27 +1703,25 @@ _ANALYZE_COMPLIANCE_SQL = text("""
 """)
 
 _CALCULATE_SUMMARY_SQL = text("""
-    WITH stream_stats AS (
+    WITH buffer_areas AS (
+        SELECT stream_id, SUM(area_sq_m) AS area_sq_m
+        FROM silver.riparian_buffers
+        GROUP BY stream_id
+    ),
+    -- One watershed/stream spatial join feeds both length and buffer area
+    stream_stats AS (
         SELECT
             w.id AS watershed_id,
             w.huc8,
             COALESCE(SUM(ST_Length(s.geom::geography)), 0)
-                AS total_stream_length_m
+                AS total_stream_length_m,
+            COALESCE(SUM(ba.area_sq_m), 0) AS total_buffer_area_sq_m
         FROM bronze.watersheds w
         LEFT JOIN bronze.streams s
             ON s.geom && w.geom AND ST_Intersects(s.geom, w.geom)
+        LEFT JOIN buffer_areas ba ON ba.stream_id = s.id
         GROUP BY w.id, w.huc8
     ),
-    buffer_stats AS (
-        SELECT
-            w.id AS watershed_id,
-            COALESCE(SUM(b.area_sq_m), 0) AS total_buffer_area_sq_m
-        FROM bronze.watersheds w
-        LEFT JOIN bronze.streams s
-            ON s.geom && w.geom AND ST_Intersects(s.geom, w.geom)
-        LEFT JOIN silver.riparian_buffers b ON b.stream_id = s.id
-        GROUP BY w.id
-    ),
     parcel_stats AS (
         SELECT
             w.id AS watershed_id,
@@ -928,7 +1744,7 @@ _CALCULATE_SUMMARY_SQL = text("""
         ss.watershed_id,
         ss.huc8,
         ss.total_stream_length_m,
-        bs.total_buffer_area_sq_m,
+        ss.total_buffer_area_sq_m,
         ps.total_parcels,
         ps.total_parcels - ps.focus_area_parcels,
         ps.focus_area_parcels,
@@ -939,8 +1755,16 @@ _CALCULATE_SUMMARY_SQL = text("""
             ELSE 100
         END
     FROM stream_stats ss
-    JOIN buffer_stats bs ON bs.watershed_id = ss.watershed_id
     JOIN parcel_stats ps ON ps.watershed_id = ss.watershed_id
+    ON CONFLICT (watershed_id) DO UPDATE
+    SET huc8 = EXCLUDED.huc8,
+        total_stream_length_m = EXCLUDED.total_stream_length_m,
+        total_buffer_area_sq_m = EXCLUDED.total_buffer_area_sq_m,
+        total_parcels = EXCLUDED.total_parcels,
+        compliant_parcels = EXCLUDED.compliant_parcels,
+        focus_area_parcels = EXCLUDED.focus_area_parcels,
+        compliance_pct = EXCLUDED.compliance_pct,
+        created_at = now()
 """)
 
 
@@ -949,36 +1773,6 @@ _CALCULATE_SUMMARY_SQL = text("""
 # ---------------------------------------------------------------------------
 
 
-def _resolve_database_url() -> str:
-    """Resolve the PostgreSQL connection URL from Aspire or env vars.
-
-    Aspire injects several env vars; prefer the URI form. Fall back to
-    converting the ADO.NET-style ConnectionStrings__ripariandb.
-    """
-    # 1. Aspire URI (already a proper postgresql:// URL)
-    url = os.environ.get("RIPARIANDB_URI") or os.environ.get("DATABASE_URL")
-    if url:
-        return url
-
-    # 2. ADO.NET connection string → convert to SQLAlchemy URL
-    ado = os.environ.get("ConnectionStrings__ripariandb")
-    if ado:
-        parts: dict[str, str] = {}
-        for part in ado.split(";"):
-            if "=" in part:
-                key, val = part.split("=", 1)
-                parts[key.strip().lower()] = val.strip()
-        host = parts.get("host", "localhost")
-        port = parts.get("port", "5432")
-        user = parts.get("username", "postgres")
-        password = parts.get("password", "")
-        database = parts.get("database", "ripariandb")
-        from urllib.parse import quote_plus
-        return f"postgresql://{quote_plus(user)}:{quote_plus(password)}@{host}:{port}/{database}"
-
-    return ""
-
-
 def main() -> None:
     """Create real dependencies and run the pipeline."""
     logging.basicConfig(
@@ -986,7 +1780,7 @@ def main() -> None:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
-    url = _resolve_database_url()
+    url = resolve_database_url()
     if not url:
         logger.error(
             "No database URL found. Set RIPARIANDB_URI, DATABASE_URL, "
@@ -995,7 +1789,7 @@ def main() -> None:
         sys.exit(1)
 
     logger.info("Connecting to database...")
-    engine = create_engine(url)
+    engine = create_pooled_engine(url)
     pipeline = EtlPipeline(
         client=ArcGISFeatureClient(),
         writer=PostGISWriter(engine),
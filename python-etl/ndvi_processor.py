@@ -11,19 +11,35 @@ Peak growing season: June–August.
 
 from __future__ import annotations
 
+import csv
+import functools
+import io
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Protocol, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Protocol,
+    runtime_checkable,
+)
 
 import geopandas as gpd
 import numpy as np
 import planetary_computer
 import pystac_client
 import rasterio
+import shapely
 from pyproj import Transformer
-from rasterio.mask import mask as rasterio_mask
-from shapely.geometry import mapping
+from rasterio.errors import WindowError
+from rasterio.features import geometry_mask, geometry_window
+from rasterio.io import DatasetReader
+from rasterio.windows import Window
+from shapely.geometry import box, shape
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import transform as shapely_transform
 from sqlalchemy import text
@@ -39,7 +55,36 @@ STAC_API_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
 SENTINEL_2_COLLECTION = "sentinel-2-l2a"
 PEAK_GROWING_MONTHS = frozenset({6, 7, 8})  # June–August for San Juan Basin
 MAX_CLOUD_COVER = 20  # percent
+STAC_PAGE_SIZE = 1_000  # items per STAC search page (Planetary Computer max)
+STAC_CACHE_SIZE = 32  # distinct searches kept per searcher
+STAC_BBOX_PRECISION = 2  # decimal degrees of search bboxes used as cache keys
 STORAGE_CRS = "EPSG:4269"
+# Sentinel-2 scene classification (SCL) classes that hide the ground:
+# 3 cloud shadow, 8 cloud medium probability, 9 cloud high probability,
+# 10 thin cirrus
+CLOUDY_SCL_CLASSES = (3, 8, 9, 10)
+MAX_BUFFER_CLOUD_FRACTION = 0.7  # skip items clouded over most of a buffer
+SCL_PROBE_MIN_CLOUD_COVER = 5  # percent; clearer scenes skip the SCL probe
+DEFAULT_MAX_WORKERS = 8  # buffers processed concurrently (network-bound)
+DEFAULT_WRITE_BATCH_SIZE = 10_000  # readings per INSERT batch
+READINGS_FLUSH_SIZE = 10_000  # readings buffered before each writer call
+BUFFER_CHUNK_SIZE = 1_000  # buffer rows streamed from PostGIS at a time
+
+# GDAL settings for signed HTTPS COG reads: reuse HTTP/2 connections across
+# worker threads, skip directory listings and sidecar probes on open, cache
+# fetched ranges (bounded per handle, 16 open at once), and keep decoded
+# blocks in a larger block cache. rasterio.Env is entered per read so the
+# options apply on every worker thread.
+GDAL_ENV_OPTIONS: dict[str, Any] = {
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_VERSION": "2",
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif",
+    "CPL_VSIL_CURL_CHUNK_SIZE": 1_048_576,
+    "VSI_CACHE": True,
+    "VSI_CACHE_SIZE": 16 * 1024 * 1024,
+    "GDAL_CACHEMAX": 512,  # MB
+}
 
 
 # ---------------------------------------------------------------------------
@@ -98,11 +143,17 @@ class PlanetaryComputerSearcher:
     """Searches Planetary Computer STAC for Sentinel-2 L2A imagery.
 
     Uses ``planetary_computer.sign_inplace`` to authenticate asset
-    URLs for direct access via rasterio.
+    URLs for direct access via rasterio. Unsigned search results are
+    cached by (bbox rounded outward, date range, cloud cover), so retries
+    and backfills repeating a search skip the catalog round-trips; every
+    call signs fresh clones, since SAS tokens expire.
     """
 
     def __init__(self, stac_url: str = STAC_API_URL) -> None:
         self._catalog = pystac_client.Client.open(stac_url)
+        self._cached_search = functools.lru_cache(maxsize=STAC_CACHE_SIZE)(
+            self._search_unsigned,
+        )
 
     def search_items(
         self,
@@ -110,57 +161,130 @@ class PlanetaryComputerSearcher:
         date_range: str,
         max_cloud_cover: int,
     ) -> list[Any]:
-        """Search for Sentinel-2 items and sign asset URLs in-place."""
+        """Search for Sentinel-2 items and return signed copies."""
+        unsigned = self._cached_search(
+            _round_bbox_outward(bbox), date_range, max_cloud_cover,
+        )
+        items = [item.clone() for item in unsigned]
+        for item in items:
+            planetary_computer.sign_inplace(item)
+        logger.debug("Found %d Sentinel-2 items for bbox %s", len(items), bbox)
+        return items
+
+    def _search_unsigned(
+        self,
+        bbox: tuple[float, float, float, float],
+        date_range: str,
+        max_cloud_cover: int,
+    ) -> tuple[Any, ...]:
+        """Run the STAC search and return the unsigned items."""
         search = self._catalog.search(
             collections=[SENTINEL_2_COLLECTION],
             bbox=bbox,
             datetime=date_range,
             query={"eo:cloud_cover": {"lt": max_cloud_cover}},
+            # Pages chain through "next" tokens and can't be fetched in
+            # parallel, so fetch as few of them as possible
+            limit=STAC_PAGE_SIZE,
         )
-        items = list(search.items())
-        for item in items:
-            planetary_computer.sign_inplace(item)
-        logger.debug("Found %d Sentinel-2 items for bbox %s", len(items), bbox)
-        return items
+        return tuple(search.items())
+
+
+def _round_bbox_outward(
+    bbox: tuple[float, float, float, float],
+) -> tuple[float, float, float, float]:
+    """Round a bbox outward to ``STAC_BBOX_PRECISION`` decimal degrees.
+
+    Nearby bboxes then share a cache key, and the rounded box still
+    contains the original.
+    """
+    scale = 10 ** STAC_BBOX_PRECISION
+    minx, miny, maxx, maxy = bbox
+    return (
+        math.floor(minx * scale) / scale,
+        math.floor(miny * scale) / scale,
+        math.ceil(maxx * scale) / scale,
+        math.ceil(maxy * scale) / scale,
+    )
 
 
 class PostGISNdviWriter:
-    """Writes NDVI readings to silver.vegetation_health in PostGIS."""
-
-    _INSERT_SQL = text("""
-        INSERT INTO silver.vegetation_health
-            (buffer_id, acquisition_date, mean_ndvi, min_ndvi, max_ndvi,
-             health_category, season_context, satellite)
-        VALUES
-            (:buffer_id, :acquisition_date, :mean_ndvi, :min_ndvi, :max_ndvi,
-             :health_category, :season_context, :satellite)
+    """Writes NDVI readings to silver.vegetation_health in PostGIS.
+
+    Readings are COPY-loaded into a temp staging table and inserted with
+    ``ON CONFLICT DO NOTHING`` in one transaction.
+
+    Args:
+        engine: SQLAlchemy engine connected to PostGIS.
+        batch_size: Maximum readings serialized per COPY buffer.
+    """
+
+    _COLUMNS = (
+        "buffer_id, acquisition_date, mean_ndvi, min_ndvi, max_ndvi, "
+        "health_category, season_context, satellite"
+    )
+
+    _CREATE_STAGING_SQL = text(f"""
+        CREATE TEMP TABLE _staging_vegetation_health ON COMMIT DROP AS
+        SELECT {_COLUMNS} FROM silver.vegetation_health WITH NO DATA
+    """)  # noqa: S608
+
+    # Explicit NULL marker so empty strings are not loaded as NULL
+    _COPY_SQL = (
+        f"COPY _staging_vegetation_health ({_COLUMNS}) "
+        "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+
+    _INSERT_SQL = text(f"""
+        INSERT INTO silver.vegetation_health ({_COLUMNS})
+        SELECT {_COLUMNS} FROM _staging_vegetation_health
         ON CONFLICT (buffer_id, acquisition_date, satellite) DO NOTHING
-    """)
+    """)  # noqa: S608
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> None:
         self._engine = engine
+        self._batch_size = batch_size
 
     def write_readings(self, readings: list[NdviReading]) -> int:
-        """Batch-insert readings into vegetation_health table."""
+        """Bulk-load readings into vegetation_health via ``COPY``.
+
+        Returns:
+            Number of readings inserted (existing keys are skipped).
+        """
         if not readings:
             return 0
-        params = [
-            {
-                "buffer_id": r.buffer_id,
-                "acquisition_date": r.acquisition_date,
-                "mean_ndvi": r.mean_ndvi,
-                "min_ndvi": r.min_ndvi,
-                "max_ndvi": r.max_ndvi,
-                "health_category": r.health_category,
-                "season_context": r.season_context,
-                "satellite": r.satellite,
-            }
-            for r in readings
-        ]
-        with self._engine.connect() as conn:
-            conn.execute(self._INSERT_SQL, params)
-            conn.commit()
-        return len(readings)
+        with self._engine.begin() as conn:
+            conn.execute(self._CREATE_STAGING_SQL)
+            with conn.connection.cursor() as cursor:
+                for start in range(0, len(readings), self._batch_size):
+                    batch = readings[start:start + self._batch_size]
+                    cursor.copy_expert(self._COPY_SQL, _readings_to_csv(batch))
+            return conn.execute(self._INSERT_SQL).rowcount
+
+
+def _readings_to_csv(readings: list[NdviReading]) -> io.StringIO:
+    """Serialize readings as CSV rows for ``COPY ... FROM STDIN``.
+
+    ``None`` is written as ``\\N``, the NULL marker in ``_COPY_SQL``.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        tuple(
+            r"\N" if value is None else value
+            for value in (
+                r.buffer_id, r.acquisition_date.isoformat(),
+                r.mean_ndvi, r.min_ndvi, r.max_ndvi,
+                r.health_category, r.season_context, r.satellite,
+            )
+        )
+        for r in readings
+    )
+    buffer.seek(0)
+    return buffer
 
 
 # ---------------------------------------------------------------------------
@@ -218,13 +342,17 @@ def calculate_ndvi(nir: np.ndarray, red: np.ndarray) -> np.ndarray:
         red: Red band values (Sentinel-2 B04).
 
     Returns:
-        NDVI array with invalid pixels set to 0.0.
+        float32 NDVI array with zero-sum pixels set to 0.0.
     """
-    nir_f = nir.astype(np.float64)
-    red_f = red.astype(np.float64)
-    with np.errstate(divide="ignore", invalid="ignore"):
-        ndvi = (nir_f - red_f) / (nir_f + red_f)
-    return np.where(np.isfinite(ndvi), ndvi, 0.0)
+    # float32 holds the 4-decimal NDVI exactly enough and halves memory
+    # traffic compared with float64; the divide writes into ``ndvi``
+    nir_f = nir.astype(np.float32, copy=False)
+    red_f = red.astype(np.float32, copy=False)
+    num = np.subtract(nir_f, red_f)
+    den = np.add(nir_f, red_f)
+    ndvi = np.zeros_like(num)
+    np.divide(num, den, out=ndvi, where=den != 0)
+    return ndvi
 
 
 def compute_ndvi_stats(ndvi: np.ndarray) -> tuple[float, float, float]:
@@ -238,10 +366,56 @@ def compute_ndvi_stats(ndvi: np.ndarray) -> tuple[float, float, float]:
     Returns:
         Tuple of (mean, min, max). Returns ``(0, 0, 0)`` if no valid pixels.
     """
-    valid = ndvi[(ndvi >= -1) & (ndvi <= 1) & np.isfinite(ndvi)]
+    # The range test also rejects NaN and +/-inf, so no isfinite pass is
+    # needed; calculate_ndvi output is always in range, so skip the copy
+    in_range = (ndvi >= -1) & (ndvi <= 1)
+    valid = ndvi if in_range.all() else ndvi[in_range]
     if valid.size == 0:
         return (0.0, 0.0, 0.0)
-    return (float(np.mean(valid)), float(np.min(valid)), float(np.max(valid)))
+    return (
+        float(valid.mean(dtype=np.float64)),
+        float(valid.min()),
+        float(valid.max()),
+    )
+
+
+def cloud_fraction(scl: np.ndarray) -> float:
+    """Fraction of clipped SCL pixels classed as cloud or cloud shadow.
+
+    Class 0 (no data, and the clip fill outside the geometry) is ignored.
+
+    Args:
+        scl: Clipped Sentinel-2 scene classification band.
+
+    Returns:
+        Cloudy fraction in [0, 1]; ``0.0`` if no pixel has data.
+    """
+    classified = scl[scl != 0]
+    if classified.size == 0:
+        return 0.0
+    return float(np.isin(classified, CLOUDY_SCL_CLASSES).mean())
+
+
+def compute_band_ndvi_stats(
+    nir: np.ndarray, red: np.ndarray,
+) -> tuple[float, float, float]:
+    """Compute NDVI mean, min, max directly from clipped band arrays.
+
+    Pixels where both bands are 0 are the clip fill outside
+    the geometry (and Sentinel-2 nodata); they are dropped before any
+    float work, so NDVI is computed only over pixels inside the buffer
+    rather than over the full clip window.
+
+    Args:
+        nir: Clipped near-infrared band values (Sentinel-2 B08).
+        red: Clipped red band values (Sentinel-2 B04).
+
+    Returns:
+        Tuple of (mean, min, max). Returns ``(0, 0, 0)`` if no pixel
+        inside the geometry has data.
+    """
+    inside = (nir != 0) | (red != 0)
+    return compute_ndvi_stats(calculate_ndvi(nir[inside], red[inside]))
 
 
 def reproject_geometry(
@@ -257,29 +431,147 @@ def reproject_geometry(
     Returns:
         Reprojected geometry.
     """
-    transformer = Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+    transformer = _get_transformer(src_crs, dst_crs)
     return shapely_transform(transformer.transform, geom)
 
 
-def clip_band_to_geometry(href: str, geom: BaseGeometry) -> np.ndarray:
-    """Clip a raster band to a geometry using rasterio.
+@functools.lru_cache(maxsize=8)
+def _get_transformer(src_crs: str, dst_crs: str) -> Transformer:
+    """Build (once per CRS pair) a thread-safe pyproj Transformer."""
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
 
-    Reprojects the geometry from EPSG:4269 to the raster's CRS before
-    clipping with ``rasterio.mask.mask()``.
+def clip_band_to_geometry(
+    href: str,
+    geom: BaseGeometry,
+    geom_crs: str = STORAGE_CRS,
+    overview_level: int | None = None,
+) -> np.ndarray:
+    """Clip a raster band to a geometry using a windowed rasterio read.
+
+    Reprojects the geometry from ``geom_crs`` to the raster's CRS (if
+    they differ), reads only band 1 within the geometry's pixel window,
+    and zeroes pixels outside the geometry in place.
 
     Args:
         href: URL or file path to the raster band (COG).
-        geom: Shapely geometry in EPSG:4269.
+        geom: Shapely geometry in ``geom_crs``.
+        geom_crs: CRS of ``geom``; defaults to EPSG:4269.
+        overview_level: COG overview to read (0 = first overview, half
+            the native resolution); ``None`` reads full resolution.
 
     Returns:
-        Clipped raster values as a 2D numpy array.
+        Clipped raster values as a 2D numpy array, 0 outside the geometry.
+
+    Raises:
+        ValueError: If the geometry does not overlap the raster.
     """
-    with rasterio.open(href) as src:
-        raster_crs = str(src.crs)
-        if raster_crs.upper() != STORAGE_CRS:
-            geom = reproject_geometry(geom, STORAGE_CRS, raster_crs)
-        clipped, _ = rasterio_mask(src, [mapping(geom)], crop=True, nodata=0)
-    return clipped[0]
+    with (
+        rasterio.Env(**GDAL_ENV_OPTIONS),
+        rasterio.open(href, **_open_options(overview_level)) as src,
+    ):
+        geom = _to_raster_crs(src, geom, geom_crs)
+        window = _geometry_window(src, geom)
+        data = src.read(1, window=window)
+        outside = _outside_mask(src, geom, window, data.shape)
+    data[outside] = 0
+    return data
+
+
+def clip_bands_to_geometry(
+    nir_href: str,
+    red_href: str,
+    geom: BaseGeometry,
+    geom_crs: str = STORAGE_CRS,
+    overview_level: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Clip the NIR and Red bands of one Sentinel-2 item to a geometry.
+
+    B08 and B04 share CRS, grid, and extent at 10 m, so the geometry is
+    reprojected, windowed, and rasterised once from the NIR dataset and
+    the same window and mask are applied to both bands. The bands are
+    read one after the other: callers already run many buffers on a
+    thread pool, so a per-call helper thread would only add start-up cost.
+
+    Args:
+        nir_href: URL or file path to the NIR band (B08 COG).
+        red_href: URL or file path to the Red band (B04 COG).
+        geom: Shapely geometry in ``geom_crs``.
+        geom_crs: CRS of ``geom``; defaults to EPSG:4269.
+        overview_level: COG overview to read; ``None`` reads full resolution.
+
+    Returns:
+        Tuple of ``(nir, red)`` 2D arrays, 0 outside the geometry.
+
+    Raises:
+        ValueError: If the geometry does not overlap the raster.
+    """
+    open_options = _open_options(overview_level)
+    with (
+        rasterio.Env(**GDAL_ENV_OPTIONS),
+        rasterio.open(nir_href, **open_options) as src,
+    ):
+        geom = _to_raster_crs(src, geom, geom_crs)
+        window = _geometry_window(src, geom)
+        nir = src.read(1, window=window)
+        outside = _outside_mask(src, geom, window, nir.shape)
+    red = _read_window(red_href, window, open_options)
+    nir[outside] = 0
+    red[outside] = 0
+    return nir, red
+
+
+def _open_options(overview_level: int | None) -> dict[str, Any]:
+    """Build ``rasterio.open`` keyword options for an optional overview."""
+    if overview_level is None:
+        return {}
+    return {"overview_level": overview_level}
+
+
+def _to_raster_crs(
+    src: DatasetReader, geom: BaseGeometry, geom_crs: str,
+) -> BaseGeometry:
+    """Reproject ``geom`` into the dataset's CRS if it differs."""
+    raster_crs = str(src.crs)
+    if raster_crs.upper() != geom_crs.upper():
+        return reproject_geometry(geom, geom_crs, raster_crs)
+    return geom
+
+
+def _geometry_window(src: DatasetReader, geom: BaseGeometry) -> Window:
+    """Return the pixel window covering ``geom``.
+
+    Raises:
+        ValueError: If the geometry does not overlap the raster.
+    """
+    # rasterio reads shapely geometries via __geo_interface__
+    try:
+        return geometry_window(src, [geom])
+    except WindowError as exc:
+        raise ValueError("Geometry does not overlap raster") from exc
+
+
+def _outside_mask(
+    src: DatasetReader,
+    geom: BaseGeometry,
+    window: Window,
+    shape: tuple[int, ...],
+) -> np.ndarray:
+    """Rasterise ``geom`` over ``window``; True where a pixel is outside."""
+    return geometry_mask(
+        [geom], out_shape=shape, transform=src.window_transform(window),
+    )
+
+
+def _read_window(
+    href: str, window: Window, open_options: dict[str, Any],
+) -> np.ndarray:
+    """Read band 1 of ``href`` within ``window``."""
+    with (
+        rasterio.Env(**GDAL_ENV_OPTIONS),
+        rasterio.open(href, **open_options) as src,
+    ):
+        return src.read(1, window=window)
 
 
 # ---------------------------------------------------------------------------
@@ -309,6 +601,70 @@ def _parse_stac_item(item: Any) -> tuple[str, str, date] | None:
     return (nir_href, red_href, item.datetime.date())
 
 
+class _SceneIndex:
+    """STAC items indexed by footprint for per-buffer lookup.
+
+    One catalog search covers every buffer; each buffer then finds its
+    scenes with an STRtree query instead of its own STAC request.
+
+    Args:
+        items: Signed STAC items.
+    """
+
+    def __init__(self, items: list[Any]) -> None:
+        self._items = items
+        self._footprints = [_item_footprint(i) for i in items]
+        self._tree = shapely.STRtree(self._footprints)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def coverage(self) -> BaseGeometry | None:
+        """Union of all item footprints, or ``None`` if there are no items."""
+        if not self._footprints:
+            return None
+        return shapely.union_all(self._footprints)
+
+    @property
+    def crs_codes(self) -> set[str]:
+        """Distinct raster CRSs advertised by the indexed items."""
+        return {crs for crs in map(_item_crs, self._items) if crs is not None}
+
+    @property
+    def latest_date(self) -> date | None:
+        """Most recent acquisition date among the items, if any."""
+        parsed = filter(None, map(_parse_stac_item, self._items))
+        return max((acq_date for _, _, acq_date in parsed), default=None)
+
+    def covering(self, geom: BaseGeometry) -> list[Any]:
+        """Return the items whose footprint intersects ``geom``, in search order."""
+        hits = self._tree.query(geom, predicate="intersects")
+        return [self._items[i] for i in sorted(hits)]
+
+
+def _item_footprint(item: Any) -> BaseGeometry:
+    """Return a STAC item's footprint geometry, falling back to its bbox."""
+    if item.geometry:
+        return shape(item.geometry)
+    return box(*item.bbox)
+
+
+def _item_crs(item: Any) -> str | None:
+    """Return the raster CRS advertised by a STAC item's projection extension.
+
+    Args:
+        item: A pystac Item.
+
+    Returns:
+        CRS string such as ``'EPSG:32612'``, or ``None`` if not advertised.
+    """
+    code = item.properties.get("proj:code")
+    if code:
+        return str(code)
+    epsg = item.properties.get("proj:epsg")
+    return f"EPSG:{epsg}" if epsg else None
+
+
 # ---------------------------------------------------------------------------
 # Processor (orchestrator)
 # ---------------------------------------------------------------------------
@@ -329,6 +685,10 @@ class NdviProcessor:
         searcher: Imagery catalog searcher.
         writer: NDVI reading writer.
         engine: SQLAlchemy engine for reading buffer geometries.
+        max_workers: Number of buffers processed concurrently.
+        overview_level: COG overview to clip from; ``None`` (default)
+            reads native 10 m pixels. Coarser levels transfer 4x less
+            data per step but leave few pixels inside 30 m buffers.
     """
 
     def __init__(
@@ -336,10 +696,14 @@ class NdviProcessor:
         searcher: ImagerySearcher,
         writer: NdviWriter,
         engine: Engine,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        overview_level: int | None = None,
     ) -> None:
         self._searcher = searcher
         self._writer = writer
         self._engine = engine
+        self._max_workers = max_workers
+        self._overview_level = overview_level
 
     def process_buffers(
         self,
@@ -355,52 +719,150 @@ class NdviProcessor:
         Returns:
             Number of NDVI readings written.
         """
-        buffers = self._load_buffers()
-        logger.info("Processing NDVI for %d buffers", len(buffers))
-
-        all_readings: list[NdviReading] = []
-        for _, row in buffers.iterrows():
-            readings = self._process_single_buffer(
-                row, date_range, max_cloud_cover,
-            )
-            all_readings.extend(readings)
+        total, bbox = self._buffer_extent()
+        logger.info("Processing NDVI for %d buffers", total)
+        if bbox is None:
+            return 0
+        scenes = self._search_scenes(bbox, date_range, max_cloud_cover)
 
-        count = self._writer.write_readings(all_readings)
+        count = self._process_and_write(
+            lambda buffer: self._process_single_buffer(*buffer, scenes),
+            self._iter_buffers(scenes.coverage()), scenes,
+        )
         logger.info("Wrote %d NDVI readings to vegetation_health", count)
         return count
 
-    def _load_buffers(self) -> gpd.GeoDataFrame:
-        """Load riparian buffer geometries from the silver schema."""
-        return gpd.read_postgis(
-            "SELECT id, geom FROM silver.riparian_buffers",
-            self._engine, geom_col="geom",
-        )
+    def _process_and_write(
+        self,
+        process: Callable[
+            [tuple[int, dict[str, BaseGeometry]]], list[NdviReading]
+        ],
+        chunks: Iterable[gpd.GeoDataFrame],
+        scenes: _SceneIndex,
+    ) -> int:
+        """Run ``process`` for every ``(buffer_id, geoms)`` and write results.
 
-    def _process_single_buffer(
+        ``geoms`` maps each scene CRS (plus EPSG:4269) to the buffer in
+        that CRS. Each chunk of buffers is reprojected with one vectorised
+        ``to_crs`` per CRS, rather than one geometry at a time per item.
+
+        Buffers run on a bounded thread pool: COG range reads are network
+        waits, and rasterio releases the GIL while GDAL reads, so buffers
+        overlap their I/O. Readings are written in buffer order every
+        ``READINGS_FLUSH_SIZE`` readings, so memory stays flat however
+        many buffers and scenes a run covers.
+
+        Returns:
+            Number of readings written.
+        """
+        crs_codes = sorted(scenes.crs_codes - {STORAGE_CRS})
+        keys = [STORAGE_CRS, *crs_codes]
+
+        written = 0
+        pending: list[NdviReading] = []
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for buffers in chunks:
+                # Iterate the underlying GeometryArrays, not the GeoSeries
+                columns = [buffers.geometry.values]
+                columns += [
+                    buffers.geometry.to_crs(crs).values for crs in crs_codes
+                ]
+                rows = (
+                    (buffer_id, dict(zip(keys, geoms)))
+                    for buffer_id, *geoms in zip(
+                        buffers["id"].to_numpy(dtype=np.int64).tolist(),
+                        *columns,
+                    )
+                )
+                for readings in executor.map(process, rows):
+                    pending.extend(readings)
+                    if len(pending) >= READINGS_FLUSH_SIZE:
+                        written += self._writer.write_readings(pending)
+                        pending = []
+        return written + self._writer.write_readings(pending)
+
+    def _search_scenes(
         self,
-        buffer_row: Any,
+        bbox: tuple[float, float, float, float],
         date_range: str,
         max_cloud_cover: int,
+    ) -> _SceneIndex:
+        """Search imagery once for the extent of all buffers."""
+        items = self._searcher.search_items(bbox, date_range, max_cloud_cover)
+        logger.info("Found %d scenes covering %s", len(items), bbox)
+        return _SceneIndex(items)
+
+    def _buffer_extent(
+        self,
+    ) -> tuple[int, tuple[float, float, float, float] | None]:
+        """Count riparian buffers and compute their combined bounding box.
+
+        Returns:
+            Tuple of ``(count, bbox)``; ``bbox`` is ``None`` when there
+            are no buffers.
+        """
+        sql = text("""
+            SELECT n, ST_XMin(e), ST_YMin(e), ST_XMax(e), ST_YMax(e)
+            FROM (
+                SELECT count(*) AS n, ST_Extent(geom) AS e
+                FROM silver.riparian_buffers
+            ) s
+        """)
+        with self._engine.connect() as conn:
+            count, *bounds = conn.execute(sql).one()
+        if not count:
+            return 0, None
+        return count, tuple(float(v) for v in bounds)
+
+    def _iter_buffers(
+        self, coverage: BaseGeometry | None,
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """Stream buffers inside ``coverage`` in ``BUFFER_CHUNK_SIZE`` frames.
+
+        The footprint filter runs in PostGIS against the buffers' GiST
+        index, so buffers no scene covers are never loaded. A server-side
+        cursor keeps only one chunk of geometries in memory at a time.
+
+        Args:
+            coverage: Union of scene footprints; ``None`` yields nothing.
+        """
+        if coverage is None:
+            return
+        sql = text("""
+            SELECT id, geom FROM silver.riparian_buffers
+            WHERE ST_Intersects(geom, ST_GeomFromWKB(:coverage, 4269))
+            ORDER BY id
+        """)
+        with self._engine.connect().execution_options(
+            stream_results=True,
+        ) as conn:
+            yield from gpd.read_postgis(
+                sql, conn, geom_col="geom",
+                params={"coverage": shapely.to_wkb(coverage)},
+                chunksize=BUFFER_CHUNK_SIZE,
+            )
+
+    def _process_single_buffer(
+        self,
+        buffer_id: int,
+        geoms: dict[str, BaseGeometry],
+        scenes: _SceneIndex,
     ) -> list[NdviReading]:
         """Process NDVI for one buffer across all available imagery."""
-        buffer_id = int(buffer_row["id"])
-        geom: BaseGeometry = buffer_row.geometry
-        bbox = geom.bounds
-
-        items = self._searcher.search_items(bbox, date_range, max_cloud_cover)
+        items = scenes.covering(geoms[STORAGE_CRS])
         if not items:
             logger.debug("No imagery found for buffer %d", buffer_id)
             return []
 
         readings: list[NdviReading] = []
         for item in items:
-            reading = self._compute_reading(buffer_id, geom, item)
+            reading = self._compute_reading(buffer_id, geoms, item)
             if reading is not None:
                 readings.append(reading)
         return readings
 
     def _compute_reading(
-        self, buffer_id: int, geom: BaseGeometry, item: Any,
+        self, buffer_id: int, geoms: dict[str, BaseGeometry], item: Any,
     ) -> NdviReading | None:
         """Compute a single NDVI reading from a STAC item clipped to a buffer."""
         parsed = _parse_stac_item(item)
@@ -408,9 +870,20 @@ class NdviProcessor:
             return None
         nir_href, red_href, acq_date = parsed
 
+        # Use the buffer pre-projected into the item's CRS when available;
+        # otherwise clip_band_to_geometry reprojects from EPSG:4269
+        geom_crs = _item_crs(item)
+        if geom_crs not in geoms:
+            geom_crs = STORAGE_CRS
+        geom = geoms[geom_crs]
+
+        if self._buffer_clouded(buffer_id, geom, geom_crs, item):
+            return None
+
         try:
-            nir = clip_band_to_geometry(nir_href, geom)
-            red = clip_band_to_geometry(red_href, geom)
+            nir, red = clip_bands_to_geometry(
+                nir_href, red_href, geom, geom_crs, self._overview_level,
+            )
         except (rasterio.RasterioIOError, ValueError):
             logger.warning(
                 "Failed to clip imagery for buffer %d from %s",
@@ -418,8 +891,7 @@ class NdviProcessor:
             )
             return None
 
-        ndvi = calculate_ndvi(nir, red)
-        mean_val, min_val, max_val = compute_ndvi_stats(ndvi)
+        mean_val, min_val, max_val = compute_band_ndvi_stats(nir, red)
         season = determine_season(acq_date)
 
         return NdviReading(
@@ -432,34 +904,86 @@ class NdviProcessor:
             season_context=season,
         )
 
+    def _buffer_clouded(
+        self,
+        buffer_id: int,
+        geom: BaseGeometry,
+        geom_crs: str,
+        item: Any,
+    ) -> bool:
+        """Check the item's SCL band for cloud over the buffer.
+
+        The 20 m SCL band is a quarter of the pixels of one 10 m band, so
+        probing it is cheap next to reading B04 and B08 for a buffer that
+        is mostly cloud. Items at or below ``SCL_PROBE_MIN_CLOUD_COVER``
+        scene-wide cloud cover, or without an SCL asset, are not probed.
+
+        Returns:
+            True if more than ``MAX_BUFFER_CLOUD_FRACTION`` of the buffer
+            is cloud or shadow.
+        """
+        cloud_cover = item.properties.get("eo:cloud_cover")
+        scl_asset = item.assets.get("SCL")
+        if (
+            scl_asset is None
+            or cloud_cover is None
+            or cloud_cover <= SCL_PROBE_MIN_CLOUD_COVER
+        ):
+            return False
+        try:
+            scl = clip_band_to_geometry(scl_asset.href, geom, geom_crs)
+        except (rasterio.RasterioIOError, ValueError):
+            return False
+
+        fraction = cloud_fraction(scl)
+        if fraction > MAX_BUFFER_CLOUD_FRACTION:
+            logger.debug(
+                "Skipping %s for buffer %d: %.0f%% cloud",
+                item.id, buffer_id, fraction * 100,
+            )
+            return True
+        return False
+
     # -- Incremental processing ---------------------------------------------
 
-    def get_last_ndvi_date(self) -> date | None:
-        """Get the most recent acquisition_date from vegetation_health.
+    def get_completed_through(self) -> date | None:
+        """Get the date incremental Sentinel-2 processing is complete through.
+
+        Readings are flushed in batches as a run progresses, so
+        ``MAX(acquisition_date)`` can be ahead of buffers a failed run
+        never reached. This date only advances once a run has finished.
 
         Returns:
-            Most recent date, or None if no readings exist.
+            Latest fully processed acquisition date, or None if no
+            incremental run has completed.
         """
-        sql = text(
-            "SELECT MAX(acquisition_date) FROM silver.vegetation_health"
-        )
         with self._engine.connect() as conn:
-            row = conn.execute(sql).fetchone()
-        return row[0] if row and row[0] else None
+            return conn.execute(_GET_NDVI_PROGRESS_SQL).scalar()
+
+    def _record_progress(self, completed_through: date | None) -> None:
+        """Advance the completed-through date after a successful run.
+
+        ``None`` (no scenes found) keeps the stored date but still
+        records the completion time.
+        """
+        with self._engine.begin() as conn:
+            conn.execute(
+                _SET_NDVI_PROGRESS_SQL, {"through": completed_through},
+            )
+
+    def get_backfill_buffer_ids(self) -> set[int]:
+        """Get ids of buffers to backfill from the start of the season.
 
-    def get_processed_keys(self) -> set[tuple[int, str, str]]:
-        """Get already-processed (buffer_id, date, satellite) combinations.
+        A buffer is backfilled once: when it has no Sentinel-2 readings
+        and was (re)generated after the last completed incremental run.
+        Buffers that never yield a reading (outside every scene, always
+        clouded) therefore do not widen every later search.
 
         Returns:
-            Set of (buffer_id, date_string, satellite) tuples.
+            Set of ``riparian_buffers.id`` values.
         """
-        sql = text("""
-            SELECT buffer_id, acquisition_date::TEXT, satellite
-            FROM silver.vegetation_health
-        """)
         with self._engine.connect() as conn:
-            rows = conn.execute(sql).fetchall()
-        return {(r[0], r[1], r[2]) for r in rows}
+            return set(conn.execute(_BACKFILL_BUFFER_IDS_SQL).scalars())
 
     def process_buffers_incremental(
         self,
@@ -467,9 +991,12 @@ class NdviProcessor:
     ) -> int:
         """Process NDVI incrementally, skipping already-processed dates.
 
-        Auto-detects the date range: from the day after the last
-        processed acquisition date through today. Falls back to the
-        current year's growing season if no prior data exists.
+        Auto-detects the date range: from the day after the date the last
+        successful run completed through, up to today. Falls back to the
+        current year's growing season if no run has completed. Buffers
+        created since the last completed run without readings (new, or
+        regenerated after their stream changed) are backfilled once from
+        the start of the growing season.
 
         Args:
             max_cloud_cover: Maximum cloud cover percentage.
@@ -479,52 +1006,57 @@ class NdviProcessor:
         """
         from datetime import datetime, timedelta
 
-        last_date = self.get_last_ndvi_date()
-        if last_date:
-            start = last_date + timedelta(days=1)
-        else:
-            # Default: start of current year's growing season
-            start = date(datetime.now().year, 6, 1)
+        # Default: start of current year's growing season
+        season_start = date(datetime.now().year, 6, 1)
+        last_date = self.get_completed_through()
+        start = last_date + timedelta(days=1) if last_date else season_start
+
+        total, bbox = self._buffer_extent()
+        if bbox is None:
+            return 0
+        backfill_ids = self.get_backfill_buffer_ids()
+        search_start = min(start, season_start) if backfill_ids else start
 
         end = date.today()
-        if start > end:
+        if search_start > end:
             logger.info("NDVI is up-to-date through %s — nothing to process", last_date)
             return 0
 
-        date_range = f"{start.isoformat()}/{end.isoformat()}"
+        date_range = f"{search_start.isoformat()}/{end.isoformat()}"
         logger.info("Incremental NDVI processing: %s", date_range)
-
-        processed = self.get_processed_keys()
-        buffers = self._load_buffers()
         logger.info(
-            "Processing NDVI for %d buffers (%d existing readings to skip)",
-            len(buffers), len(processed),
+            "Processing NDVI for %d buffers (%d to backfill)",
+            total, len(backfill_ids),
         )
+        scenes = self._search_scenes(bbox, date_range, max_cloud_cover)
 
-        all_readings: list[NdviReading] = []
-        for _, row in buffers.iterrows():
-            readings = self._process_single_buffer_incremental(
-                row, date_range, max_cloud_cover, processed,
-            )
-            all_readings.extend(readings)
-
-        count = self._writer.write_readings(all_readings)
+        count = self._process_and_write(
+            lambda buffer: self._process_single_buffer_incremental(
+                *buffer, scenes, start, backfill_ids,
+            ),
+            self._iter_buffers(scenes.coverage()), scenes,
+        )
+        self._record_progress(scenes.latest_date)
         logger.info("Wrote %d new NDVI readings", count)
         return count
 
     def _process_single_buffer_incremental(
         self,
-        buffer_row: Any,
-        date_range: str,
-        max_cloud_cover: int,
-        processed: set[tuple[int, str, str]],
+        buffer_id: int,
+        geoms: dict[str, BaseGeometry],
+        scenes: _SceneIndex,
+        start: date,
+        backfill_ids: set[int],
     ) -> list[NdviReading]:
-        """Process NDVI for one buffer, skipping already-processed items."""
-        buffer_id = int(buffer_row["id"])
-        geom: BaseGeometry = buffer_row.geometry
-        bbox = geom.bounds
+        """Process NDVI for one buffer, skipping already-processed items.
 
-        items = self._searcher.search_items(bbox, date_range, max_cloud_cover)
+        ``start`` is the day after the latest stored acquisition, so
+        buffers with readings only need items from ``start`` on; no
+        stored reading can collide with them. Earlier items are processed
+        only for buffers in ``backfill_ids``.
+        """
+        backfilling = buffer_id in backfill_ids
+        items = scenes.covering(geoms[STORAGE_CRS])
         if not items:
             return []
 
@@ -534,10 +1066,47 @@ class NdviProcessor:
             if parsed is None:
                 continue
             _, _, acq_date = parsed
-            key = (buffer_id, str(acq_date), "Sentinel-2")
-            if key in processed:
+            if acq_date < start and not backfilling:
                 continue
-            reading = self._compute_reading(buffer_id, geom, item)
+            reading = self._compute_reading(buffer_id, geoms, item)
             if reading is not None:
                 readings.append(reading)
         return readings
+
+
+# ---------------------------------------------------------------------------
+# Incremental processing SQL
+# ---------------------------------------------------------------------------
+
+_GET_NDVI_PROGRESS_SQL = text("""
+    SELECT completed_through FROM meta.ndvi_progress
+    WHERE satellite = 'Sentinel-2'
+""")
+
+_BACKFILL_BUFFER_IDS_SQL = text("""
+    SELECT b.id
+    FROM silver.riparian_buffers b
+    WHERE b.processed_at > COALESCE(
+        (
+            SELECT completed_at FROM meta.ndvi_progress
+            WHERE satellite = 'Sentinel-2'
+        ),
+        '-infinity'
+    )
+    AND NOT EXISTS (
+        SELECT 1 FROM silver.vegetation_health v
+        WHERE v.buffer_id = b.id AND v.satellite = 'Sentinel-2'
+    )
+""")
+
+# GREATEST ignores NULL, so a run that found no scenes keeps the old date
+_SET_NDVI_PROGRESS_SQL = text("""
+    INSERT INTO meta.ndvi_progress (satellite, completed_through, completed_at)
+    VALUES ('Sentinel-2', :through, now())
+    ON CONFLICT (satellite) DO UPDATE
+    SET completed_through = GREATEST(
+            meta.ndvi_progress.completed_through,
+            EXCLUDED.completed_through
+        ),
+        completed_at = EXCLUDED.completed_at
+""")
@@ -37,6 +37,8 @@ class RunRecord:
 class RunTracker:
     """Manages ETL run lifecycle in meta.etl_runs.
 
+    Each lifecycle call runs in a single ``engine.begin()`` transaction.
+
     Args:
         engine: SQLAlchemy engine connected to PostGIS.
     """
@@ -53,14 +55,8 @@ class RunTracker:
         Returns:
             The auto-generated run ID.
         """
-        sql = text("""
-            INSERT INTO meta.etl_runs (run_type, status)
-            VALUES (:run_type, 'running')
-            RETURNING id
-        """)
-        with self._engine.connect() as conn:
-            row = conn.execute(sql, {"run_type": run_type}).fetchone()
-            conn.commit()
+        with self._engine.begin() as conn:
+            row = conn.execute(_START_SQL, {"run_type": run_type}).fetchone()
         run_id: int = row[0]
         logger.info("Started ETL run %d (type=%s)", run_id, run_type)
         return run_id
@@ -87,20 +83,8 @@ class RunTracker:
             parcels_changed: Whether bronze.parcels had inserts or updates.
             buffers_changed: Whether silver.riparian_buffers was regenerated.
         """
-        sql = text("""
-            UPDATE meta.etl_runs
-            SET completed_at = now(),
-                status = 'completed',
-                records_inserted = :inserted,
-                records_updated = :updated,
-                records_skipped = :skipped,
-                streams_changed = :streams,
-                parcels_changed = :parcels,
-                buffers_changed = :buffers
-            WHERE id = :run_id
-        """)
-        with self._engine.connect() as conn:
-            conn.execute(sql, {
+        with self._engine.begin() as conn:
+            conn.execute(_COMPLETE_SQL, {
                 "run_id": run_id,
                 "inserted": records_inserted,
                 "updated": records_updated,
@@ -109,7 +93,6 @@ class RunTracker:
                 "parcels": parcels_changed,
                 "buffers": buffers_changed,
             })
-            conn.commit()
         logger.info(
             "Completed ETL run %d: %d inserted, %d updated, %d skipped",
             run_id, records_inserted, records_updated, records_skipped,
@@ -122,16 +105,8 @@ class RunTracker:
             run_id: The run to mark as failed.
             error: Human-readable error description.
         """
-        sql = text("""
-            UPDATE meta.etl_runs
-            SET completed_at = now(),
-                status = 'failed',
-                error_message = :error
-            WHERE id = :run_id
-        """)
-        with self._engine.connect() as conn:
-            conn.execute(sql, {"run_id": run_id, "error": error})
-            conn.commit()
+        with self._engine.begin() as conn:
+            conn.execute(_FAIL_SQL, {"run_id": run_id, "error": error})
         logger.error("Failed ETL run %d: %s", run_id, error)
 
     def get_last_successful_run(self, run_type: str) -> RunRecord | None:
@@ -143,18 +118,10 @@ class RunTracker:
         Returns:
             RunRecord or None if no successful run exists.
         """
-        sql = text("""
-            SELECT id, run_type, started_at, completed_at, status,
-                   records_inserted, records_updated, records_skipped,
-                   error_message, streams_changed, parcels_changed,
-                   buffers_changed
-            FROM meta.etl_runs
-            WHERE run_type = :run_type AND status = 'completed'
-            ORDER BY completed_at DESC
-            LIMIT 1
-        """)
         with self._engine.connect() as conn:
-            row = conn.execute(sql, {"run_type": run_type}).fetchone()
+            row = conn.execute(
+                _LAST_SUCCESSFUL_SQL, {"run_type": run_type},
+            ).fetchone()
         if row is None:
             return None
         return RunRecord(
@@ -164,3 +131,46 @@ class RunTracker:
             error_message=row[8], streams_changed=row[9],
             parcels_changed=row[10], buffers_changed=row[11],
         )
+
+
+# ---------------------------------------------------------------------------
+# SQL statements
+# ---------------------------------------------------------------------------
+
+_START_SQL = text("""
+    INSERT INTO meta.etl_runs (run_type, status)
+    VALUES (:run_type, 'running')
+    RETURNING id
+""")
+
+_COMPLETE_SQL = text("""
+    UPDATE meta.etl_runs
+    SET completed_at = now(),
+        status = 'completed',
+        records_inserted = :inserted,
+        records_updated = :updated,
+        records_skipped = :skipped,
+        streams_changed = :streams,
+        parcels_changed = :parcels,
+        buffers_changed = :buffers
+    WHERE id = :run_id
+""")
+
+_FAIL_SQL = text("""
+    UPDATE meta.etl_runs
+    SET completed_at = now(),
+        status = 'failed',
+        error_message = :error
+    WHERE id = :run_id
+""")
+
+_LAST_SUCCESSFUL_SQL = text("""
+    SELECT id, run_type, started_at, completed_at, status,
+           records_inserted, records_updated, records_skipped,
+           error_message, streams_changed, parcels_changed,
+           buffers_changed
+    FROM meta.etl_runs
+    WHERE run_type = :run_type AND status = 'completed'
+    ORDER BY completed_at DESC
+    LIMIT 1
+""")
@@ -73,11 +73,12 @@ CREATE TABLE bronze.parcels (
     owner_name      TEXT,
     land_acres      NUMERIC(12, 4),
     geom            geometry(MultiPolygon, 4269) NOT NULL,
-    imported_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+    imported_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+    -- Also backs ON CONFLICT (parcel_id) in the ETL parcel loads
+    CONSTRAINT uq_parcels_parcel_id UNIQUE (parcel_id)
 );
 
 CREATE INDEX idx_parcels_geom ON bronze.parcels USING gist (geom);
-CREATE INDEX idx_parcels_parcel_id ON bronze.parcels (parcel_id);
 
 -- USDA Watersheds (HUC boundaries)
 CREATE TABLE bronze.watersheds (
@@ -171,10 +172,11 @@ CREATE TABLE gold.riparian_summary (
     healthy_buffer_pct      NUMERIC(5, 2),
     degraded_buffer_pct     NUMERIC(5, 2),
     bare_buffer_pct         NUMERIC(5, 2),
-    created_at              TIMESTAMPTZ NOT NULL DEFAULT now()
+    created_at              TIMESTAMPTZ NOT NULL DEFAULT now(),
+    -- One summary row per watershed; refreshed via ON CONFLICT by the ETL
+    CONSTRAINT uq_riparian_summary_watershed_id UNIQUE (watershed_id)
 );
 
-CREATE INDEX idx_riparian_summary_watershed_id ON gold.riparian_summary (watershed_id);
 CREATE INDEX idx_riparian_summary_huc8 ON gold.riparian_summary (huc8);
 
 COMMIT;
@@ -1,5 +1,6 @@
 -- Incremental Update System Migration
--- Adds: meta.etl_runs tracking table, unique constraints for upsert support
+-- Adds: meta.etl_runs tracking table, meta.layer_state change digests,
+--       meta.ndvi_progress, unique constraints for upsert support
 -- Safe to run multiple times (IF NOT EXISTS / IF NOT EXISTS patterns)
 
 BEGIN;
@@ -32,6 +33,22 @@ CREATE INDEX IF NOT EXISTS idx_etl_runs_status
 CREATE INDEX IF NOT EXISTS idx_etl_runs_started
     ON meta.etl_runs (started_at DESC);
 
+-- Source-layer fingerprints; incremental runs skip layers whose digest
+-- matches the last successful load
+CREATE TABLE IF NOT EXISTS meta.layer_state (
+    layer               TEXT PRIMARY KEY,
+    digest              TEXT NOT NULL,
+    checked_at          TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Acquisition date incremental NDVI is complete through; advanced only
+-- after a run has written every reading, so a failed run is retried
+CREATE TABLE IF NOT EXISTS meta.ndvi_progress (
+    satellite           TEXT PRIMARY KEY,
+    completed_through   DATE,
+    completed_at        TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
 -- ============================================================
 -- Unique constraints required for upsert (ON CONFLICT) support
 -- ============================================================
@@ -53,6 +70,25 @@ BEGIN
     END IF;
 END $$;
 
+-- Keep only the newest summary row per watershed before adding constraint
+DELETE FROM gold.riparian_summary rs
+WHERE rs.id NOT IN (
+    SELECT MAX(id) FROM gold.riparian_summary GROUP BY watershed_id
+);
+
+-- Summary refresh key (one row per watershed)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'uq_riparian_summary_watershed_id'
+    ) THEN
+        ALTER TABLE gold.riparian_summary
+            ADD CONSTRAINT uq_riparian_summary_watershed_id
+            UNIQUE (watershed_id);
+    END IF;
+END $$;
+
 -- Vegetation health deduplication key
 DO $$
 BEGIN